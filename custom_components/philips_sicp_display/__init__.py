@@ -38,6 +38,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 	try:
 		await coordinator.async_config_entry_first_refresh()
 	except Exception as exc:  # noqa: BLE001 - bubble up as ConfigEntryNotReady
+		await client.async_close()
 		raise ConfigEntryNotReady from exc
 
 	hass.data[DOMAIN][entry.entry_id] = {
@@ -53,6 +54,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 	"""Unload a config entry."""
 	unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 	if unload_ok:
-		hass.data[DOMAIN].pop(entry.entry_id, None)
+		entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+		if entry_data:
+			await entry_data[DATA_CLIENT].async_close()
 
 	return unload_ok
\ No newline at end of file
@@ -108,6 +108,8 @@ class PhilipsSicpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             raise CannotConnect from exc
         except Exception as exc:  # noqa: BLE001
             raise InvalidResponse(str(exc)) from exc
+        finally:
+            await client.async_close()
 
         serial = data.serial_number or normalized_mac
         title = data.model_info.get("model_number") if data.model_info else None
@@ -5,7 +5,7 @@ import asyncio
 import inspect
 import logging
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import Any, Awaitable, Mapping, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
@@ -39,6 +39,16 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Reads of one poll kept in flight at once. Replies are matched to requests in
+# order, so this also bounds how many reads fail together if the link desyncs.
+_MAX_CONCURRENT_READS = 4
+
+# Seconds a GET reply is reused for identical reads, e.g. an entity refresh
+# right after a poll
+_GET_CACHE_TTL = 0.5
+
 
 @dataclass(slots=True)
 class SicpDisplayData:
@@ -62,6 +72,26 @@ class SicpDisplayData:
     mute: bool | None
 
 
+async def _read_optional(
+    coro: Awaitable[_T],
+    failure: str,
+    *,
+    unsupported: str | None = None,
+    default: _T | None = None,
+) -> _T | None:
+    """Await an optional status read, logging and returning a default on failure."""
+    try:
+        return await coro
+    except NotSupportedOrNotAvailableError:
+        if unsupported is None:
+            _LOGGER.debug(failure, exc_info=True)
+        else:
+            _LOGGER.debug(unsupported)
+    except Exception:  # noqa: BLE001 - optional metric, ignore
+        _LOGGER.debug(failure, exc_info=True)
+    return default
+
+
 class SicpDisplayClient:
     """Async client that proxies calls to a Philips SICP display."""
 
@@ -73,110 +103,71 @@ class SicpDisplayClient:
         monitor_id = entry_data.get(CONF_MONITOR_ID, DEFAULT_MONITOR_ID)
         port = entry_data.get(CONF_PORT) or DEFAULT_PORT or SICP_DEFAULT_PORT
 
-        self._monitor = SICPIPMonitor(host, monitor_id=monitor_id, port=port)
+        self._monitor = SICPIPMonitor(host, monitor_id=monitor_id, port=port, cache_ttl=_GET_CACHE_TTL)
+        self._read_slots = asyncio.Semaphore(_MAX_CONCURRENT_READS)
 
-    async def fetch_status(self) -> SicpDisplayData:
-        """Fetch the latest state from the display."""
-
-        power_state:PowerState | None = None
-        try:
-            power_state = await self._monitor.get_power_state()
-        except Exception:
-            _LOGGER.debug("Unable to read power state", exc_info=True)
-
-        brightness: int | None = None
-        try:
-            brightness = await self._monitor.get_brightness_level()
-        except NotSupportedOrNotAvailableError:
-            _LOGGER.debug("Brightness level unsupported on this source or power saving mode")
-        except Exception:  # noqa: BLE001 - optional metric, ignore
-            _LOGGER.debug("Brightness level unavailable", exc_info=True)
+    async def _read(self, coro: Awaitable[_T]) -> _T:
+        """Await a single display read, with at most _MAX_CONCURRENT_READS in flight."""
+        async with self._read_slots:
+            return await coro
 
-        precise_color_temperature: int | None = None
-        try:
-            precise_color_temperature = await self._monitor.get_precise_color_temperature()
-        except NotSupportedOrNotAvailableError:
-            _LOGGER.debug("Precise color temperature unsupported on this source")
-        except Exception:
-            _LOGGER.debug("Unable to read precise color temperature", exc_info=True)
-
-        backlight_on: bool | None = None
-        try:
-            backlight_on = await self._monitor.get_backlight_state()
-        except Exception:
-            _LOGGER.debug("Unable to read backlight state", exc_info=True)
-
-        temperatures = []
-        try:
-            temperatures = await self._monitor.get_temperature()
-        except Exception:
-            _LOGGER.debug("Unable to read temperature sensors", exc_info=True)
-
-        # will raise an error if unable to read
-        serial_number = None
-        try:
-            serial_number = await self._monitor.get_serial_number()
-        except Exception:
-            _LOGGER.debug("Unable to read serial number", exc_info=True)
-        
-        model_info: dict[str, str] = {}
-        try:
-            model_info = await self._collect_model_info()
-        except Exception:
-            _LOGGER.debug("Unable to read model info", exc_info=True)
-        
-        sicp_info: dict[str, str] = {}
-        try:
-            sicp_info = await self._collect_sicp_info()
-        except Exception:
-            _LOGGER.debug("Unable to read SICP info", exc_info=True)
-
-        smart_power_level: SmartPowerLevel | None = None
-        try:
-            smart_power_level = await self._monitor.get_smart_power_level()
-        except NotSupportedOrNotAvailableError:
-            _LOGGER.debug("Smart power level unsupported")
-        except Exception:
-            _LOGGER.debug("Unable to read smart power level", exc_info=True)
-        
-        power_on_logo_mode: PowerOnLogoMode | None = None
-        try:
-            power_on_logo_mode = await self._monitor.get_power_on_logo_mode()
-        except NotSupportedOrNotAvailableError:
-            _LOGGER.debug("Power-on logo control unsupported")
-        except Exception:
-            _LOGGER.debug("Unable to read power-on logo mode", exc_info=True)
-
-        cold_start_state: ColdStartPowerState | None = None
-        try:
-            cold_start_state = await self._monitor.get_cold_start_power_state()
-        except Exception:
-            _LOGGER.debug("Unable to read cold-start power state", exc_info=True)
-
-        input_source: InputSource | None = None
-        try:
-            input_source = await self._monitor.get_input_source()
-        except Exception:
-            _LOGGER.debug("Unable to read input source", exc_info=True)
-
-        remote_lock_state: RemoteLockState | None = None
-        try:
-            remote_lock_state = await self._monitor.get_remote_lock_state()
-        except Exception:
-            _LOGGER.debug("Unable to read remote lock state", exc_info=True)
-
-        volume_speaker: int | None = None
-        volume_audio_out: int | None = None
-        try:
-            volume_speaker, volume_audio_out = await self._monitor.get_volume()
-        except Exception:
-            _LOGGER.debug("Unable to read volume levels", exc_info=True)
-
-        mute: bool | None = None
-        try:
-            mute = await self._monitor.get_mute()
-        except Exception:
-            _LOGGER.debug("Unable to read mute state", exc_info=True)
+    async def fetch_status(self) -> SicpDisplayData:
+        """Fetch the latest state from the display.
+
+        Reads are issued concurrently so the monitor pipelines them over a
+        single connection, a few at a time, instead of paying one round trip per value.
+        """
+
+        (
+            power_state,
+            brightness,
+            precise_color_temperature,
+            backlight_on,
+            temperatures,
+            serial_number,
+            model_info,
+            sicp_info,
+            smart_power_level,
+            power_on_logo_mode,
+            cold_start_state,
+            input_source,
+            remote_lock_state,
+            volume,
+            mute,
+        ) = await asyncio.gather(
+            _read_optional(self._read(self._monitor.get_power_state()), "Unable to read power state"),
+            _read_optional(
+                self._read(self._monitor.get_brightness_level()),
+                "Brightness level unavailable",
+                unsupported="Brightness level unsupported on this source or power saving mode",
+            ),
+            _read_optional(
+                self._read(self._monitor.get_precise_color_temperature()),
+                "Unable to read precise color temperature",
+                unsupported="Precise color temperature unsupported on this source",
+            ),
+            _read_optional(self._read(self._monitor.get_backlight_state()), "Unable to read backlight state"),
+            _read_optional(self._read(self._monitor.get_temperature()), "Unable to read temperature sensors", default=[]),
+            _read_optional(self._read(self._monitor.get_serial_number()), "Unable to read serial number"),
+            _read_optional(self._collect_model_info(), "Unable to read model info", default={}),
+            _read_optional(self._collect_sicp_info(), "Unable to read SICP info", default={}),
+            _read_optional(
+                self._read(self._monitor.get_smart_power_level()),
+                "Unable to read smart power level",
+                unsupported="Smart power level unsupported",
+            ),
+            _read_optional(
+                self._read(self._monitor.get_power_on_logo_mode()),
+                "Unable to read power-on logo mode",
+                unsupported="Power-on logo control unsupported",
+            ),
+            _read_optional(self._read(self._monitor.get_cold_start_power_state()), "Unable to read cold-start power state"),
+            _read_optional(self._read(self._monitor.get_input_source()), "Unable to read input source"),
+            _read_optional(self._read(self._monitor.get_remote_lock_state()), "Unable to read remote lock state"),
+            _read_optional(self._read(self._monitor.get_volume()), "Unable to read volume levels", default=(None, None)),
+            _read_optional(self._read(self._monitor.get_mute()), "Unable to read mute state"),
+        )
+        volume_speaker, volume_audio_out = volume
 
         return SicpDisplayData(
             power_state=power_state,
@@ -197,6 +188,10 @@ class SicpDisplayClient:
             mute=mute,
         )
 
+    async def async_close(self) -> None:
+        """Close the connection to the display."""
+        await self._monitor.close()
+
     async def set_power(self, power_on: bool) -> bool:
         """Set the display power state."""
         return bool(await self._monitor.set_power(power_on))
@@ -241,12 +236,18 @@ class SicpDisplayClient:
             "build_date": ModelInfoFields.BUILD_DATE,
             "android_firmware": ModelInfoFields.ANDROID_FIRMWARE,
         }
+        results = await asyncio.gather(
+            *(self._read(self._monitor.get_model_info(enum_field)) for enum_field in fields.values()),
+            return_exceptions=True,
+        )
         info: dict[str, str] = {}
-        for key, enum_field in fields.items():
-            try:
-                info[key] = await self._monitor.get_model_info(enum_field)
-            except (IndexError, NetworkError, RuntimeError):
-                _LOGGER.debug("Unable to read %s from model info", key, exc_info=True)
+        for key, result in zip(fields, results):
+            if isinstance(result, (IndexError, NetworkError, RuntimeError)):
+                _LOGGER.debug("Unable to read %s from model info", key, exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                info[key] = result
         return info
 
     async def _collect_sicp_info(self) -> dict[str, str]:
@@ -256,13 +257,19 @@ class SicpDisplayClient:
             "platform_version": SicpInfoFields.PLATFORM_VERSION,
             "custom_intent_version": SicpInfoFields.CUSTOM_INTENT_VERSION,
         }
-        for key, enum_field in fields.items():
-            try:
-                info[key] = await self._monitor.get_sicp_info(enum_field)
-            except NotSupportedOrNotAvailableError:
+        results = await asyncio.gather(
+            *(self._read(self._monitor.get_sicp_info(enum_field)) for enum_field in fields.values()),
+            return_exceptions=True,
+        )
+        for key, result in zip(fields, results):
+            if isinstance(result, NotSupportedOrNotAvailableError):
                 info[key] = "N/A"
-            except (IndexError, NetworkError, RuntimeError):
-                _LOGGER.debug("Unable to read %s from SICP info", key, exc_info=True)
+            elif isinstance(result, (IndexError, NetworkError, RuntimeError)):
+                _LOGGER.debug("Unable to read %s from SICP info", key, exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                info[key] = result
         return info
 
 
@@ -1,10 +1,11 @@
 import sys
 import asyncio
+from functools import cache
 from typing import List
 from .ip_monitor import SICPIPMonitor
 
 from .easycli import (
-    print_class_methods_as_commands,
+    format_class_methods_as_commands,
     async_execute_command_and_return_log,
     CommandError,
 )
@@ -13,33 +14,68 @@ DISPLAYS = {
     0: ("192.168.45.210", 1),
     1: ("192.168.45.211", 1),
 }
+# (ip, monitor ID) of every display, for the "all" target
+_ALL_DISPLAYS = tuple(DISPLAYS.values())
 
-def print_usage():
+# Separates the commands of a batch, e.g. `0 get_power_state + get_volume`
+_COMMAND_SEPARATOR = "+"
+
+_USAGE_TEMPLATE = """Usage: {argv0} <monitor_id|all> <command> [args] [+ <command> [args] ...]
+
+Available monitors:
+{monitors}
+Commands:
+{commands}"""
+
+@cache
+def _usage_text(argv0:str) -> str:
+    """Build the usage text once, it only depends on static tables."""
+    monitors = "".join(f"  {key}: Monitor ID {mon_id}: {ip}\n" for key, (ip, mon_id) in DISPLAYS.items())
+    commands = format_class_methods_as_commands(SICPIPMonitor, ignore_methods={"send_message", "close"})
+    return _USAGE_TEMPLATE.format(argv0=argv0, monitors=monitors, commands=commands)
+
+def print_usage(argv0:str|None = None):
     """Print usage information."""
-    print(f"Usage: {sys.argv[0]} <monitor_id|all> <command> [args]")
-    print("\nAvailable monitors:")
-    for key, (ip, mon_id) in DISPLAYS.items():
-        print(f"  {key}: Monitor ID {mon_id}: {ip}")
-    print("\nCommands:")
-    print_class_methods_as_commands(SICPIPMonitor, ignore_methods={"send_message"})
-
-async def _run_command_for_monitor(monitor:SICPIPMonitor, command:str, args:list[str]) -> bool:
+    sys.stdout.write(_usage_text(sys.argv[0] if argv0 is None else argv0))
+
+def _split_commands(args:list[str]) -> list[list[str]]:
+    """Split `cmd [args] + cmd [args] ...` into one argument list per command."""
+    commands = [[]]
+    for arg in args:
+        if arg == _COMMAND_SEPARATOR:
+            commands.append([])
+        else:
+            commands[-1].append(arg)
+    return [command for command in commands if command]
+
+async def _run_command(monitor:SICPIPMonitor, command:str, args:list[str]) -> tuple[bool, str]:
+    """Run a command on one monitor, returning whether it succeeded and the line to report."""
     try:
         res = await async_execute_command_and_return_log(monitor, command, args)
     except CommandError as ce:
-        print(f"⚠ {monitor.ip}: {ce}")
-        return False
+        return False, f"⚠ {monitor.ip}: {ce}"
     except Exception as exc:
-        print(f"⚠ {monitor.ip} Error: {exc}")
-        return False
+        return False, f"⚠ {monitor.ip} Error: {exc}"
     else:
-        print(f"✓ {monitor.ip}: {res}")
-        return True
+        return True, f"✓ {monitor.ip}: {res}"
+
+async def _run_commands_for_monitor(monitor:SICPIPMonitor, commands:list[list[str]]) -> tuple[bool, list[str]]:
+    """
+    Run a batch of commands on one monitor, returning whether all succeeded and the lines to report.
+    The commands are issued together: each one queues its frame as soon as it starts, in the order
+    given, so the frames are pipelined over the monitor's connection in that order and a GET after
+    a SET reads the new state. This relies on every command sending a single frame.
+    """
+    try:
+        results = await asyncio.gather(*(_run_command(monitor, command[0], command[1:]) for command in commands))
+    finally:
+        await monitor.close()
+    return all(ok for ok, _line in results), [line for _ok, line in results]
 
 
 def _build_monitor_list(arg:str) -> List[SICPIPMonitor]:
     if arg.lower() == "all":
-        return [SICPIPMonitor(ip=ip, monitor_id=mon_id) for (ip, mon_id) in DISPLAYS.values()]
+        return [SICPIPMonitor(ip=ip, monitor_id=mon_id) for (ip, mon_id) in _ALL_DISPLAYS]
 
     try:
         monitor_key = int(arg)
@@ -56,13 +92,13 @@ def _build_monitor_list(arg:str) -> List[SICPIPMonitor]:
 
 async def _async_main(argv:list[str]) -> int:
     if len(argv) < 3:
-        print_usage()
+        print_usage(argv[0])
         return 1
 
     monitor_arg = argv[1]
-    raw_command_args = argv[2:]
-    if not raw_command_args:
-        print_usage()
+    commands = _split_commands(argv[2:])
+    if not commands:
+        print_usage(argv[0])
         return 1
 
     try:
@@ -71,14 +107,19 @@ async def _async_main(argv:list[str]) -> int:
         print(f"Error: {exc}")
         return 1
 
-    success_count = 0
-    for monitor in monitors:
-        ok = await _run_command_for_monitor(monitor, raw_command_args[0], raw_command_args[1:])
-        if ok:
-            success_count += 1
-
-    print(f"\n{'✓' if success_count == len(monitors) else '⚠'} Command succeeded on {success_count}/{len(monitors)} displays")
-    return 0 if success_count == len(monitors) else 1
+    if len(monitors) == 1:
+        # Common case: nothing to overlap, run inline without wrapping it in a task
+        results = [await _run_commands_for_monitor(monitors[0], commands)]
+    else:
+        # Displays are independent: overlap their round trips, then report in monitor order
+        results = await asyncio.gather(*(_run_commands_for_monitor(monitor, commands) for monitor in monitors))
+    success_count = sum(ok for ok, _lines in results)
+    all_ok = success_count == len(monitors)
+    # Whole report in one write
+    report = [line for _ok, lines in results for line in lines]
+    report.append(f"\n{'✓' if all_ok else '⚠'} Command succeeded on {success_count}/{len(monitors)} displays\n")
+    sys.stdout.write("\n".join(report))
+    return 0 if all_ok else 1
 
 
 def main():
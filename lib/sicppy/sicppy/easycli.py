@@ -1,31 +1,71 @@
 import asyncio
 import inspect
-from typing import Any
+import sys
+import types
+from functools import cache
+from typing import Any, Union, get_args, get_origin
 from enum import Enum
 
+# Spellings of a true boolean argument, anything else is false
+_TRUE_TOKENS = frozenset(("true", "1", "yes", "on"))
+
+# Spellings of "leave unchanged" for an optional argument such as `set_volume none 30`
+_NONE_TOKENS = frozenset(("none", "-"))
+
+# Separators ignored when matching enum names, so "hdmi-1", "HDMI_1" and "hdmi1" are equal
+_NAME_SEPARATORS = str.maketrans("", "", "-_ ")
+
+def _normalize_name(name:str) -> str:
+    return name.casefold().translate(_NAME_SEPARATORS)
+
+@cache
+def _enum_lookup(enum_cls:type[Enum]) -> dict[str, Enum]:
+    """Map the normalized name of every member and alias of `enum_cls` to its member, built once per enum."""
+    return {_normalize_name(name): member for name, member in enum_cls.__members__.items()}
+
+@cache
+def _enum_options(enum_cls:type[Enum]) -> str:
+    """Return the `a|b|c` list of member names and aliases of `enum_cls`, each listed once, built once per enum."""
+    return '|'.join([name.lower() for name in enum_cls.__members__])
+
 def snake_case_to_human_readable(name:str) -> str:
     """Convert snake_case string to human readable format."""
     return name.replace("_", " ").title()
 
+@cache
+def _optional_inner_type(type_:Any) -> Any:
+    """Return `X` for an `X | None` annotation, None for any other annotation."""
+    if get_origin(type_) not in (Union, types.UnionType):
+        return None
+    args = get_args(type_)
+    if len(args) != 2 or type(None) not in args:
+        return None
+    return args[0] if args[1] is type(None) else args[1]
+
+@cache
 def get_type_options(type_:Any) -> tuple[str, str|None]:
     """Get possible options for a given type."""
+    inner_type = _optional_inner_type(type_)
+    if inner_type is not None:
+        type_options, enum_description = get_type_options(inner_type)
+        return f"{type_options}|none", enum_description
     if type_ is bool:
         return "true|false", None
     elif type_ is int:
         return "<0-100>", None
     elif isinstance(type_, Enum) or isinstance(type_, type) and issubclass(type_, Enum):
         enum_name = type_.__name__
-        return f"<{enum_name}>", f"{enum_name}: <{'|'.join([e.name.lower() for e in type_.__dict__.values() if isinstance(e, Enum)])}>"
+        return f"<{enum_name}>", f"{enum_name}: <{_enum_options(type_)}>"
     else:
         return "<value>", None
 
-def print_class_methods_as_commands(cls, ignore_methods:set[str] = set()):
+def format_class_methods_as_commands(cls, ignore_methods:set[str] = set()) -> str:
+    """Describe the public methods of `cls` as commands, one block of lines per method."""
+    lines = []
     for attr in dir(cls):
         if not attr.startswith("_") and callable(getattr(cls, attr)) and attr not in ignore_methods:
-            print(f"  {attr}", end="")
-
             enum_arg_descriptions = []
-            # print args
+            # describe args
             method = getattr(cls, attr)
             if method.__code__.co_argcount > 1:
                 args = method.__code__.co_varnames[1:method.__code__.co_argcount]
@@ -47,22 +87,26 @@ def print_class_methods_as_commands(cls, ignore_methods:set[str] = set()):
                         arg_list.append(f"[{arg}:{type_options}]")
                     else:
                         arg_list.append(f"{arg}:{type_options}")
-                print(f" {' '.join(arg_list)}")
+                lines.append(f"  {attr} {' '.join(arg_list)}")
             else:
-                print()
-            
-            # Print method signature
-            method = getattr(cls, attr)
+                lines.append(f"  {attr}")
+
+            # Method description
             if method.__doc__:
                 first_line = method.__doc__.strip().splitlines()[0]
-                print(f"     {first_line}")
+                lines.append(f"     {first_line}")
             else:
-                print()
+                lines.append("")
 
-            # Print enum descriptions if any
+            # Enum descriptions if any
             for enum_desc in enum_arg_descriptions:
                 if enum_desc:
-                    print(f"     {enum_desc}")
+                    lines.append(f"     {enum_desc}")
+
+    return "".join(f"{line}\n" for line in lines)
+
+def print_class_methods_as_commands(cls, ignore_methods:set[str] = set()):
+    sys.stdout.write(format_class_methods_as_commands(cls, ignore_methods))
                 
 
 class CommandError(Exception):
@@ -91,26 +135,72 @@ async def async_execute_command_and_return_log(instance:Any, command_name:str, c
 
 def _coerce_argument(value:str, expected_type:Any):
     if expected_type is bool:
-        return value.lower() in ("true", "1", "yes", "on")
+        return value.lower() in _TRUE_TOKENS
     if expected_type is int:
         return int(value)
     if inspect.isclass(expected_type) and issubclass(expected_type, Enum):
-        return expected_type[value.upper()]
+        return _resolve_enum_argument(value, expected_type)
+    inner_type = _optional_inner_type(expected_type)
+    if inner_type is not None:
+        return _parse_optional_argument(value, inner_type)
     return value
 
 
+def _parse_optional_argument(value:str, expected_type:Any):
+    """Coerce an `X | None` argument: a none token gives None, anything else is parsed as `X`."""
+    if value.lower() in _NONE_TOKENS:
+        return None
+    return _coerce_argument(value, expected_type)
+
+
+def _resolve_enum_argument(value:str, enum_cls:type[Enum]):
+    """Resolve a member name or alias of `enum_cls`, or a raw 0-255 code such as `13` or `0x0D`."""
+    member = _enum_lookup(enum_cls).get(_normalize_name(value))
+    if member is not None:
+        return member
+
+    try:
+        code = int(value, 0)
+    except ValueError:
+        code = None
+    if code is None or not 0 <= code <= 0xFF:
+        raise CommandError(
+            f"Unknown {enum_cls.__name__} '{value}', expected a code 0-255 or one of: {_enum_options(enum_cls)}"
+        )
+    # Codes without a name are passed through as-is, newer displays may support them
+    return _enum_lookup_by_code(enum_cls).get(code, code)
+
+
+@cache
+def _enum_lookup_by_code(enum_cls:type[Enum]) -> dict[Any, Enum]:
+    return {member.value: member for member in enum_cls}
+
+
+@cache
+def _command_table(cls:type) -> dict[str, tuple[Any, ...]]:
+    """Map every public method of `cls` to the expected types of its positional arguments, built once per class."""
+    table = {}
+    for attr in dir(cls):
+        if attr.startswith("_"):
+            continue
+        method = getattr(cls, attr)
+        code = getattr(method, "__code__", None)
+        if code is None:
+            continue
+        annotations = getattr(method, "__annotations__", {})
+        table[attr] = tuple(annotations.get(name, str) for name in code.co_varnames[1:code.co_argcount])
+    return table
+
+
 def _prepare_command_execution(instance:Any, command_name:str, command_args:list[str]):
-    if not hasattr(instance, command_name):
+    arg_types = _command_table(type(instance)).get(command_name)
+    if arg_types is None:
         raise CommandError(f"Unknown command '{command_name}'")
+    if len(command_args) > len(arg_types):
+        raise CommandError(f"Command '{command_name}' takes at most {len(arg_types)} argument(s)")
 
     command_method = getattr(instance, command_name)
-    typed_args = []
-    annotations = getattr(command_method, "__annotations__", {})
-    for index, arg in enumerate(command_args):
-        param_name = command_method.__code__.co_varnames[index + 1]
-        expected_type = annotations.get(param_name, str)
-        typed_args.append(_coerce_argument(arg, expected_type))
-
+    typed_args = [_coerce_argument(arg, expected_type) for arg, expected_type in zip(command_args, arg_types)]
     return command_method, typed_args
 
 
@@ -1,65 +1,332 @@
 #!/usr/bin/env python3
 
 import asyncio
+import logging
+import socket
+from collections import deque
+from collections.abc import Awaitable
 
 from .response import SicpResponse
 from .protocol import SICPProtocol
+from .messages import SICPCommand, RESPONSE_NAV, RESPONSE_NACK
 from .errors import NetworkError, ProtocolError, NotSupportedOrNotAvailableError, ChecksumOrFormatError
 
 DEFAULT_PORT = 5000
 TIMEOUT = 2
 
+logger = logging.getLogger(__name__)
+
+MAX_FRAME_SIZE = 0xFF  # SICP frames carry their total length in a single byte
+
+# Communication Control response code -> exception raised for it
+_RESPONSE_ERRORS = {
+    RESPONSE_NAV: (NotSupportedOrNotAvailableError, "Command not supported or not available (NAV response)"),
+    RESPONSE_NACK: (ChecksumOrFormatError, "Checksum or format error (NACK response)"),
+}
+
+def _expects_reply(message) -> bool:
+    # Broadcast commands (monitor ID 0) are not answered by the displays
+    return len(message) < 2 or message[1] != 0
+
+
+class _SicpFrameProtocol(asyncio.BufferedProtocol):
+    """Split the incoming byte stream into SICP frames, reading into a reusable buffer."""
+
+    def __init__(self, on_frame, on_lost) -> None:
+        # Incomplete frames are moved to the front once the complete ones are consumed,
+        # so the free space never drops below MAX_FRAME_SIZE
+        self._buffer = bytearray(MAX_FRAME_SIZE * 4)
+        self._view = memoryview(self._buffer)
+        self._filled = 0
+        self._on_frame = on_frame
+        self._on_lost = on_lost
+        self._drain_waiter: asyncio.Future | None = None
+        self.transport: asyncio.Transport | None = None
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+        # Frames are a few bytes each: never hold them back waiting for an ACK (Nagle).
+        # asyncio already does this for TCP sockets, set it explicitly to not depend on it
+        sock = transport.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # The connection idles between polls: let the OS notice a display that went away
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._view[self._filled:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._filled += nbytes
+        start = 0
+        while start < self._filled:
+            end = start + max(self._buffer[start], 1)
+            if end > self._filled:
+                break
+            # Replies outlive the buffer, so each frame is copied out exactly once
+            self._on_frame(bytes(self._view[start:end]))
+            start = end
+
+        if start:
+            remaining = self._filled - start
+            if remaining:
+                # memoryview assignment handles the overlap without an intermediate copy
+                self._view[:remaining] = self._view[start:self._filled]
+            self._filled = remaining
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_exception(exc or ConnectionResetError("Connection lost"))
+        if not self.closed.done():
+            self.closed.set_result(None)
+        self._on_lost(self, exc)
+
+    def pause_writing(self) -> None:
+        self._drain_waiter = asyncio.get_running_loop().create_future()
+
+    def resume_writing(self) -> None:
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+        self._drain_waiter = None
+
+    async def drain(self) -> None:
+        """Wait until the transport write buffer is below its high-water mark."""
+        if self._drain_waiter is not None:
+            await self._drain_waiter
+
 class SICPIPMonitor(SICPProtocol):
-    def __init__(self, ip:str, monitor_id=1, port=DEFAULT_PORT, timeout=TIMEOUT) -> None:
+    def __init__(self, ip:str, monitor_id=1, port=DEFAULT_PORT, timeout=TIMEOUT, cache_ttl=0) -> None:
         super().__init__(monitor_id=monitor_id)
         self.ip = ip
         self.port = port
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+
+        # Single persistent connection shared by all commands. Replies are matched
+        # to requests in FIFO order as frames arrive, so concurrent commands are
+        # pipelined instead of waiting for each other's round trip. Each request
+        # remembers its command byte so that an out-of-order reply is detected.
+        self._protocol: _SicpFrameProtocol | None = None
+        self._pending: deque[tuple[int | None, asyncio.Future]] = deque()
+        # Replies expected and received on the current connection, and the read
+        # timeout of each batch keyed by the reply count that completes it
+        self._replies_expected = 0
+        self._replies_received = 0
+        self._deadlines: deque[tuple[int, asyncio.TimerHandle]] = deque()
+        self._write_lock = asyncio.Lock()
+        # Frames queued by concurrent callers, written together by a single flush
+        self._outbox: list[tuple[bytes, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        # GET frame -> (future of its raw reply, expiry time once answered)
+        self._get_cache: dict[bytes, tuple[asyncio.Future, float]] = {}
+
+    async def _ensure_connected(self) -> _SicpFrameProtocol:
+        """Open the connection if not connected yet."""
+        protocol = self._protocol
+        if protocol is not None and not protocol.transport.is_closing():
+            return protocol
+
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(self.timeout): # connection timeout
+                _transport, protocol = await loop.create_connection(
+                    lambda: _SicpFrameProtocol(self._resolve_reply, self._connection_lost),
+                    self.ip,
+                    self.port,
+                )
+        except TimeoutError as exc:
+            raise NetworkError("Communication timed out") from exc
+        except OSError as exc:
+            raise NetworkError(exc) from exc
+
+        self._protocol = protocol
+        return protocol
+
+    def _resolve_reply(self, frame: bytes) -> None:
+        """Resolve the oldest pending request with an incoming frame."""
+        if not self._pending:
+            logger.debug("Discarding unsolicited frame from %s: %s", self.ip, frame.hex(' '))
+            return
+        command, future = self._pending.popleft()
+        reply_command = frame[3] if len(frame) > 3 else None
+        # Data replies echo the command, ACK/NAV/NACK come as Communication Control
+        if reply_command != command and reply_command != SICPCommand.COMMUNICATION_CONTROL:
+            # A reply went missing or arrived late: every later one would be handed
+            # to the wrong caller, start over on a fresh connection instead
+            error = ProtocolError(f"Out of sequence reply from {self.ip}: {frame.hex(' ')}")
+            if not future.done():
+                future.set_exception(error)
+            self._drop_connection(self._protocol, error)
+            return
+
+        self._replies_received += 1
+        while self._deadlines and self._deadlines[0][0] <= self._replies_received:
+            self._deadlines.popleft()[1].cancel()  # batch complete
+        if not future.done():
+            future.set_result(frame)
+
+    def _connection_lost(self, protocol: _SicpFrameProtocol, exc: Exception | None) -> None:
+        error = NetworkError(exc) if exc else NetworkError("Connection closed by monitor")
+        self._drop_connection(protocol, error)
+
+    def _drop_connection(self, protocol: _SicpFrameProtocol | None, error: Exception) -> None:
+        """Close the given connection and fail every request still waiting on it."""
+        if protocol is None or protocol is not self._protocol:
+            return
+
+        self._protocol = None
+        protocol.transport.close()
+        # The display may have changed state while we were not connected
+        self._get_cache.clear()
+
+        while self._deadlines:
+            self._deadlines.popleft()[1].cancel()
+        self._replies_expected = self._replies_received = 0
+
+        while self._pending:
+            _command, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self) -> None:
+        """Close the persistent connection to the monitor."""
+        protocol = self._protocol
+        if protocol is None:
+            return
+
+        self._drop_connection(protocol, NetworkError("Connection closed"))
+        await protocol.closed
+
+    async def _send_raw_batch(self, frames: list[tuple[bytes, asyncio.Future]]) -> None:
+        """Write several frames back-to-back and drain the transport once."""
+        try:
+            async with self._write_lock:
+                protocol = await self._ensure_connected()
+                for frame, future in frames:
+                    if _expects_reply(frame):
+                        self._pending.append((frame[3] if len(frame) > 3 else None, future))
+                        self._replies_expected += 1
+                    elif not future.done():
+                        future.set_result(None)
+                    protocol.transport.write(frame)
+                self._arm_reply_deadline(protocol)
+            await protocol.drain()
+        except (NetworkError, OSError) as exc:
+            error = exc if isinstance(exc, NetworkError) else NetworkError(exc)
+            self._drop_connection(self._protocol, error)
+            for _frame, future in frames:
+                if not future.done():
+                    future.set_exception(error)
+
+    def _arm_reply_deadline(self, protocol: _SicpFrameProtocol) -> None:
+        """
+        Schedule a single read timeout covering every reply of the batch just written.
+        It is cancelled by _resolve_reply() once the last of them arrives.
+        """
+        expected = self._replies_expected
+        if expected > self._replies_received and (not self._deadlines or self._deadlines[-1][0] < expected):
+            handle = asyncio.get_running_loop().call_later(self.timeout, self._expire_batch, protocol)
+            self._deadlines.append((expected, handle))
+
+    def _expire_batch(self, protocol: _SicpFrameProtocol) -> None:
+        # A missing reply would shift every later reply by one: start over
+        self._drop_connection(protocol, NetworkError("Communication timed out"))
+
+    async def _flush_outbox(self) -> None:
+        frames, self._outbox = self._outbox, []
+        await self._send_raw_batch(frames)
+
+    def _flush_done(self, task: asyncio.Task, frames: list[tuple[bytes, asyncio.Future]]) -> None:
+        """Fail the callers of a flush that was cancelled or crashed, the flush task itself is not awaited."""
+        if task.cancelled():
+            error = NetworkError("Request cancelled before it was sent")
+        elif task.exception() is None:
+            return
+        else:
+            error = NetworkError(task.exception())
+        if self._outbox is frames:
+            self._outbox = []  # Cancelled before it could take its frames
+        self._drop_connection(self._protocol, error)
+        for _frame, future in frames:
+            if not future.done():
+                future.set_exception(error)
 
     async def send_message(self, message, expect_data=False) -> SicpResponse | None:
         """
         Send SICP message to display and return parsed response.
-        
+
+        Frames sent by concurrent callers within the same event loop iteration
+        are written together with a single drain.
+
+        Identical GET queries share one request while it is in flight, and for
+        `cache_ttl` seconds after its reply (0 by default: not kept). Each caller
+        still gets its own SicpResponse. Any SET clears these shared replies.
+
         Args:
-            monitor_id: Monitor ID
-            ip: IP address
             message: Message bytes to send
             expect_data: True if expecting data response (GET command), False for ACK (SET command)
-        
+
         Returns:
-            SicpResponse object or None on error
+            SicpResponse of the data reply (GET) or of the ACK (SET), None for
+            broadcast frames (monitor ID 0) which are not answered
+
+        Raises:
+            NetworkError: connection failed or closed, or the reply timed out
+            ProtocolError: reply missing, malformed or out of sequence
+            NotSupportedOrNotAvailableError: NAV reply
+            ChecksumOrFormatError: NACK reply
         """
-        reader = None
-        writer = None
-        response_data = None
+        if not expect_data:
+            # The display state may change: later GETs must see it
+            self._get_cache.clear()
+            return await self._request(message)
 
-        try:
-            connect_coro = asyncio.open_connection(self.ip, self.port)
-            # connection timeout
-            reader, writer = await asyncio.wait_for(connect_coro, timeout=self.timeout)
+        key = bytes(message)
+        cached = self._get_cache.get(key)
+        if cached is not None and (not cached[0].done() or asyncio.get_running_loop().time() < cached[1]):
+            future = cached[0]
+        else:
+            future = self._queue_frame(message)
+            self._get_cache[key] = (future, float("inf"))
+            future.add_done_callback(lambda done: self._cache_reply(key, done))
+        # Shielded so that a cancelled caller does not cancel the request the others wait on
+        return await self._read_reply(message, asyncio.shield(future))
 
-            writer.write(message)
-            # write timeout
-            await asyncio.wait_for(writer.drain(), timeout=None) #self.timeout)
+    def _cache_reply(self, key: bytes, future: asyncio.Future) -> None:
+        """Keep a successful GET reply for `cache_ttl` seconds, forget failed ones."""
+        cached = self._get_cache.get(key)
+        if cached is None or cached[0] is not future:
+            return  # Invalidated while in flight
+        if not self.cache_ttl or future.cancelled() or future.exception() is not None:
+            del self._get_cache[key]
+        else:
+            self._get_cache[key] = (future, asyncio.get_running_loop().time() + self.cache_ttl)
 
-            if expect_data:
-                response_data = await asyncio.wait_for(reader.read(1024), timeout=self.timeout) # read timeout
+    def _queue_frame(self, message) -> asyncio.Future:
+        """Queue a frame for the next flush, returning the future of its raw reply."""
+        future = asyncio.get_running_loop().create_future()
+        if not self._outbox:
+            # First frame of a burst: flush once the other ready callers have queued theirs
+            self._flush_task = asyncio.create_task(self._flush_outbox())
+            outbox = self._outbox
+            self._flush_task.add_done_callback(lambda task: self._flush_done(task, outbox))
+        self._outbox.append((message, future))
+        return future
 
-        except asyncio.TimeoutError as exc:
-            raise NetworkError("Communication timed out") from exc
-        except OSError as exc:
-            raise NetworkError(exc) from exc
-        except Exception as exc:
-            raise Exception(exc) from exc
-        finally:
-            if writer is not None:
-                writer.close()
-                try:
-                    await writer.wait_closed()
-                except Exception:
-                    pass
+    async def _request(self, message) -> SicpResponse | None:
+        """Queue a frame for the next flush and parse the reply."""
+        return await self._read_reply(message, self._queue_frame(message))
 
-        if not expect_data:
+    async def _read_reply(self, message, reply: Awaitable[bytes | None]) -> SicpResponse | None:
+        """Wait for the raw reply of a queued frame and parse it."""
+        command = message[3] if len(message) > 3 else None
+
+        # Read timeout is enforced once per flushed batch, see _arm_reply_deadline().
+        # Transport failures already reach the future as NetworkError
+        response_data = await reply
+
+        if not _expects_reply(message):
             return None  # No response expected for broadcast commands
         if not response_data:
             raise ProtocolError("No response received from monitor")
@@ -67,20 +334,17 @@ class SICPIPMonitor(SICPProtocol):
         try:
             response = SicpResponse(response_data)
 
-            if response.is_nav:
-                raise NotSupportedOrNotAvailableError("Command not supported or not available (NAV response)")
-            if response.is_nack:
-                raise ChecksumOrFormatError("Checksum or format error (NACK response)")
+            error = _RESPONSE_ERRORS.get(response.response_code)
+            if error is not None:
+                error_cls, error_message = error
+                raise error_cls(error_message)
             if not response.valid:
                 raise RuntimeError("Invalid response received from monitor")
 
-            command = message[3] if len(message) > 3 else None
-            payload = response.data_payload or []
+            payload = response.data_payload
             if command is not None and payload and payload[0] == command and len(payload) > 1:
                 response.data_payload = payload[1:]
-            else:
-                response.data_payload = payload
 
             return response
         except IndexError as exc:
-            raise ProtocolError("Malformed response payload") from exc
\ No newline at end of file
+            raise ProtocolError("Malformed response payload") from exc
@@ -1,4 +1,8 @@
+import struct
+from collections.abc import Callable
 from enum import IntEnum
+from functools import lru_cache, reduce
+from operator import xor
 
 # SICP message structure:      [size][monitor_id][group_id][command][param][checksum]
 # size = total message length (including size and checksum bytes)
@@ -313,16 +317,22 @@ class ApmMode(IntEnum):
     MODE2 = 0x03
 
 
-def calculate_checksum(*bytes_list):
+def calculate_checksum(*bytes_list: int) -> int:
     """Calculate XOR checksum of all bytes."""
-    checksum = 0
-    for byte in bytes_list:
-        checksum ^= byte
-    return checksum
+    return reduce(xor, bytes_list, 0)
 
 
-def construct_message(monitor_id, command, *params, msg_size=None, group_id=GROUP_ID):
-    """Construct a SICP message with automatic size and checksum calculation."""
+def construct_message(
+    monitor_id: int,
+    command: int,
+    *params: int,
+    msg_size: int | None = None,
+    group_id: int = GROUP_ID,
+) -> bytes:
+    """
+    Construct a SICP message with automatic size and checksum calculation.
+    Parameters may be plain ints or IntEnum members, no need to unwrap `.value`.
+    """
     if not (0 <= monitor_id <= 0xFF):
         raise ValueError("Monitor ID must be between 0 and 255")
 
@@ -335,25 +345,113 @@ def construct_message(monitor_id, command, *params, msg_size=None, group_id=GROU
     if not (0 <= msg_size <= 0xFF):
         raise ValueError("Message size must be between 0 and 255")
 
-    checksum = calculate_checksum(msg_size, monitor_id, group_id, command, *params)
-    return bytes([msg_size, monitor_id, group_id, command, *params, checksum])
+    body = bytes((msg_size, monitor_id, group_id, command, *params))
+    return body + bytes((calculate_checksum(*body),))
+
+
+# Commands sent without parameters: their frame only depends on the monitor ID
+PARAMETERLESS_COMMANDS = (
+    SICPCommand.POWER_STATE_GET,
+    SICPCommand.COLD_START_GET,
+    SICPCommand.TEMPERATURE_GET,
+    SICPCommand.SERIAL_GET,
+    SICPCommand.VIDEO_SIGNAL_GET,
+    SICPCommand.PICTURE_STYLE_GET,
+    SICPCommand.VIDEO_PARAMETERS_GET,
+    SICPCommand.COLOR_TEMPERATURE_GET,
+    SICPCommand.COLOR_TEMPERATURE_FINE_GET,
+    SICPCommand.TEST_PATTERN_GET,
+    SICPCommand.REMOTE_LOCK_GET,
+    SICPCommand.POWER_ON_LOGO_GET,
+    SICPCommand.OSD_INFO_GET,
+    SICPCommand.AUTO_SIGNAL_GET,
+    SICPCommand.POWER_SAVE_GET,
+    SICPCommand.SMART_POWER_GET,
+    SICPCommand.APM_GET,
+    SICPCommand.GROUP_ID_GET,
+    SICPCommand.BACKLIGHT_GET,
+    SICPCommand.ANDROID_4K_GET,
+    SICPCommand.WOL_GET,
+    SICPCommand.VOLUME_GET,
+    SICPCommand.MUTE_GET,
+    SICPCommand.AV_MUTE_GET,
+    SICPCommand.CURRENT_SOURCE_GET,
+)
+
+
+def build_get_message(monitor_id: int, command: SICPCommand) -> bytes:
+    """
+    Build the frame of a parameterless command.
+    Protocol instances build these once per monitor ID, see SICPProtocol._tmpl.
+    """
+    if not (0 <= monitor_id <= 0xFF):
+        raise ValueError("Monitor ID must be between 0 and 255")
+    if command not in PARAMETERLESS_COMMANDS:
+        raise ValueError(f"{command!r} takes parameters")
+    return bytes((5, monitor_id, GROUP_ID, command, 5 ^ monitor_id ^ GROUP_ID ^ command))
+
+
+# Builders are pure functions of their arguments: monitors sharing an ID
+# (e.g. one display per IP, all at ID 1) share the same closures
+@lru_cache(maxsize=1024)
+def make_message_builder(
+    monitor_id: int,
+    command: int,
+    param_count: int = 1,
+    group_id: int = GROUP_ID,
+) -> Callable[..., bytes]:
+    """
+    Return a function building `command` frames for `monitor_id` from `param_count` parameters.
+    The constant header and its share of the checksum are computed once, only the
+    parameter bytes are XORed in per call.
+    """
+    header = construct_message(monitor_id, command, *([0] * param_count), group_id=group_id)[:4]
+    header_checksum = calculate_checksum(*header)
+    # Parameters and checksum packed in one C call, instead of going through a tuple
+    pack = struct.Struct(f"{param_count + 1}B").pack
+
+    if param_count == 1:
+        def build_message(param: int) -> bytes:
+            try:
+                return header + pack(param, header_checksum ^ param)
+            except struct.error as exc:
+                raise ValueError(f"Parameter out of range: {param}") from exc
+    elif param_count == 2:
+        # Volume and IP parameter frames: XOR inline rather than reducing a tuple
+        def build_message(first: int, second: int) -> bytes:
+            try:
+                return header + pack(first, second, header_checksum ^ first ^ second)
+            except struct.error as exc:
+                raise ValueError(f"Parameters out of range: {(first, second)}") from exc
+    else:
+        def build_message(*params: int) -> bytes:
+            if len(params) != param_count:
+                raise ValueError(f"Expected {param_count} parameters, got {len(params)}")
+            try:
+                return header + pack(*params, calculate_checksum(header_checksum, *params))
+            except struct.error as exc:
+                raise ValueError(f"Parameters out of range: {params}") from exc
+
+    return build_message
 
 
 def build_video_parameters_set_message(
-    monitor_id,
-    brightness=0xFF,
-    color=0xFF,
-    contrast=0xFF,
-    sharpness=0xFF,
-    tint=0xFF,
-    black_level=0xFF,
-    gamma=0xFF,
-):
+    monitor_id: int,
+    brightness: int = 0xFF,
+    color: int = 0xFF,
+    contrast: int = 0xFF,
+    sharpness: int = 0xFF,
+    tint: int = 0xFF,
+    black_level: int = 0xFF,
+    gamma: int = 0xFF,
+) -> bytes:
     """
     Build SICP message to set video parameters (0x32 command).
     0xFF for any parameter means "no change".
     """
-    payload = [
+    return construct_message(
+        monitor_id,
+        SICPCommand.VIDEO_PARAMETERS_SET,
         brightness & 0xFF,
         color & 0xFF,
         contrast & 0xFF,
@@ -361,10 +459,13 @@ def build_video_parameters_set_message(
         tint & 0xFF,
         black_level & 0xFF,
         gamma & 0xFF,
-    ]
-    return construct_message(monitor_id, SICPCommand.VIDEO_PARAMETERS_SET, *payload)
+    )
 
-def build_volume_set_message(monitor_id, speaker_level, audio_out_level=None):
+def build_volume_set_message(
+    monitor_id: int,
+    speaker_level: int | None,
+    audio_out_level: int | None = None,
+) -> bytes:
     """
     Build SICP message to set speaker/audio-out volume.
     0xFF for any level means "no change".
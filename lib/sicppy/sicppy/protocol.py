@@ -1,13 +1,13 @@
-import string
+import struct
 from abc import abstractmethod
 import logging
 
 from .errors import NetworkError
 from .messages import (
-    construct_message,
+    make_message_builder,
+    build_get_message,
+    PARAMETERLESS_COMMANDS,
     SICPCommand,
-    build_video_parameters_set_message,
-    build_volume_set_message,
     SicpInfoFields,
     ModelInfoFields,
     PowerState,
@@ -42,33 +42,161 @@ def _coerce_kelvin_to_step_value(kelvin_value):
     resolved_kelvin = step * 100
     return step, resolved_kelvin
 
+# Every byte outside the printable ASCII range (0x20-0x7E), deleted by _printable_ascii()
+_NON_PRINTABLE = bytes(b for b in range(0x100) if not 0x20 <= b <= 0x7E)
+
+# Deleted by translate() to check that a value only holds decimal / hex digits
+_DIGITS = b"0123456789"
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+_IP_ADDRESS_PARAMETERS = frozenset((
+    IPParameterCode.IP,
+    IPParameterCode.SUBNET,
+    IPParameterCode.GATEWAY,
+    IPParameterCode.DNS1,
+    IPParameterCode.DNS2,
+))
+_MAC_ADDRESS_PARAMETERS = frozenset((IPParameterCode.ETH_MAC, IPParameterCode.WIFI_MAC))
+
+def _printable_ascii(data) -> str:
+    """Decode the printable ASCII characters of a bytes-like object, dropping the rest."""
+    return bytes(data).translate(None, _NON_PRINTABLE).decode("ascii")
+
+def _require_payload(response, description: str):
+    """Return the data payload of a GET reply, raising if there is none."""
+    payload = response.data_payload if response else None
+    if not payload:
+        raise RuntimeError(f"Unable to read {description}")
+    return payload
+
 def _format_ip_parameter_value(parameter_code, value_bytes):
-    ascii_text = ''.join(chr(b) for b in value_bytes if 32 <= b <= 126)
-    raw_hex = ''.join(f"{b:02X}" for b in value_bytes)
+    # value_bytes may be any bytes-like object, e.g. a memoryview slice of the reply
+    value_bytes = bytes(value_bytes)
+    ascii_bytes = value_bytes.translate(None, _NON_PRINTABLE)
+    ascii_text = ascii_bytes.decode("ascii")
+    raw_hex = value_bytes.hex().upper()
     formatted = None
 
-    if parameter_code in {0x01, 0x02, 0x03, 0x04, 0x05} and len(ascii_text) == 12 and ascii_text.isdigit():
-        octets = []
-        for i in range(0, 12, 3):
-            octet = int(ascii_text[i:i + 3])
-            octets.append(str(octet))
-        formatted = '.'.join(octets)
-    elif parameter_code in {0x06, 0x07}:
+    if parameter_code in _IP_ADDRESS_PARAMETERS and len(ascii_bytes) == 12 and not ascii_bytes.translate(None, _DIGITS):
+        # Zero-padded decimal octets: "192168001010" -> "192.168.1.10"
+        formatted = f"{int(ascii_text[0:3])}.{int(ascii_text[3:6])}.{int(ascii_text[6:9])}.{int(ascii_text[9:12])}"
+    elif parameter_code in _MAC_ADDRESS_PARAMETERS:
         if len(value_bytes) == 6:
-            formatted = ':'.join(f"{b:02X}" for b in value_bytes)
-        elif len(ascii_text) == 12 and all(c in string.hexdigits for c in ascii_text):
-            pairs = [ascii_text[i:i + 2].upper() for i in range(0, 12, 2)]
-            formatted = ':'.join(pairs)
+            formatted = value_bytes.hex(':').upper()
+        elif len(ascii_bytes) == 12 and not ascii_bytes.translate(None, _HEX_DIGITS):
+            # Hex digits as text: convert back to the raw address, then format it like above
+            formatted = bytes.fromhex(ascii_text).hex(':').upper()
 
     if not formatted:
         formatted = ascii_text or raw_hex or "(no data)"
 
     return formatted, ascii_text, raw_hex
 
+# Commands taking a single 0x00 (off) / 0x01 (on) parameter
+_TOGGLE_COMMANDS = (
+    SICPCommand.MUTE_SET,
+    SICPCommand.AV_MUTE_SET,
+    SICPCommand.ANDROID_4K_SET,
+    SICPCommand.WOL_SET,
+    SICPCommand.BACKLIGHT_SET,
+)
+
+# [parameter code][value type] prefix of IP parameter replies
+_IP_PARAMETER_HEADER = struct.Struct("BB")
+
+def _code_table(enum_cls) -> tuple:
+    """Return a 256-entry tuple mapping every byte value to its `enum_cls` member, or None."""
+    table = [None] * 0x100
+    for member in enum_cls:
+        table[member] = member
+    return tuple(table)
+
+# Direct byte -> member lookups, skipping the generic Enum constructor on the reply path
+_INPUT_SOURCE_BY_CODE = _code_table(InputSource)
+_POWER_STATE_BY_CODE = _code_table(PowerState)
+_COLD_START_POWER_STATE_BY_CODE = _code_table(ColdStartPowerState)
+_PICTURE_STYLE_BY_CODE = _code_table(PictureStyle)
+_COLOR_TEMPERATURE_MODE_BY_CODE = _code_table(ColorTemperatureMode)
+_TEST_PATTERN_BY_CODE = _code_table(TestPattern)
+_REMOTE_LOCK_STATE_BY_CODE = _code_table(RemoteLockState)
+_POWER_ON_LOGO_MODE_BY_CODE = _code_table(PowerOnLogoMode)
+_AUTO_SIGNAL_MODE_BY_CODE = _code_table(AutoSignalMode)
+_POWER_SAVE_MODE_BY_CODE = _code_table(PowerSaveMode)
+_SMART_POWER_LEVEL_BY_CODE = _code_table(SmartPowerLevel)
+_APM_MODE_BY_CODE = _code_table(ApmMode)
+
+# Commands with variable parameters, mapped to their parameter count
+_PARAMETERIZED_COMMANDS = {
+    SICPCommand.POWER_STATE_SET: 1,
+    SICPCommand.COLD_START_SET: 1,
+    SICPCommand.SICP_INFO_GET: 1,
+    SICPCommand.MODEL_INFO_GET: 1,
+    SICPCommand.PICTURE_STYLE_SET: 1,
+    SICPCommand.COLOR_TEMPERATURE_SET: 1,
+    SICPCommand.COLOR_TEMPERATURE_FINE_SET: 1,
+    SICPCommand.TEST_PATTERN_SET: 1,
+    SICPCommand.REMOTE_LOCK_SET: 1,
+    SICPCommand.REMOTE_CONTROL_SIM: 2,
+    SICPCommand.POWER_ON_LOGO_SET: 1,
+    SICPCommand.OSD_INFO_SET: 1,
+    SICPCommand.AUTO_SIGNAL_SET: 1,
+    SICPCommand.POWER_SAVE_SET: 1,
+    SICPCommand.SMART_POWER_SET: 1,
+    SICPCommand.APM_SET: 1,
+    SICPCommand.GROUP_ID_SET: 1,
+    SICPCommand.MONITOR_ID_SET: 1,
+    SICPCommand.IP_PARAMETER_GET: 2,
+    SICPCommand.INPUT_SOURCE_SET: 4,
+    SICPCommand.VOLUME_SET: 2,
+    SICPCommand.VIDEO_PARAMETERS_SET: 7,
+}
+
+# 0xFF leaves a volume level or video parameter unchanged
+_NO_CHANGE = 0xFF
+
+def _volume_parameter(label: str, level: int | None) -> int:
+    """Validate a 0-100 volume level and return its parameter byte (None = no change)."""
+    if level is None:
+        return _NO_CHANGE
+    if 0 <= level <= 100:
+        return level
+    raise ValueError(f"{label} volume must be between 0 and 100")
+
 class SICPProtocol:
     def __init__(self, monitor_id=1) -> None:
         self.monitor_id = monitor_id
 
+    @property
+    def monitor_id(self) -> int:
+        return self._monitor_id
+
+    @monitor_id.setter
+    def monitor_id(self, value: int) -> None:
+        self._monitor_id = value
+        self._build_message_templates()
+
+    def _build_message_templates(self) -> None:
+        """Precompute the constant frames for the current monitor ID."""
+        self._tmpl = {
+            command: build_get_message(self._monitor_id, command)
+            for command in PARAMETERLESS_COMMANDS
+        }
+        # Indexed by the parameter byte: [0x00 frame, 0x01 frame]
+        self._toggle_tmpl = {
+            command: (build(0x00), build(0x01))
+            for command, build in (
+                (command, make_message_builder(self._monitor_id, command)) for command in _TOGGLE_COMMANDS
+            )
+        }
+        # Indexed by power_on: [screen OFF frame, screen ON frame]
+        build_power = make_message_builder(self._monitor_id, SICPCommand.POWER_STATE_SET)
+        self._power_tmpl = (build_power(PowerState.POWER_OFF), build_power(PowerState.POWER_ON))
+        # Frame builders specialized for this monitor ID
+        self._builders = {
+            command: make_message_builder(self._monitor_id, command, param_count)
+            for command, param_count in _PARAMETERIZED_COMMANDS.items()
+        }
+
     @abstractmethod
     async def send_message(self, message, expect_data=False) -> SicpResponse | None:
         """Abstract method to send a SICP message to the display."""
@@ -76,140 +204,115 @@ class SICPProtocol:
 
     async def set_power(self, power_on:bool):
         """Control display power state."""
-        param = PowerState.POWER_ON if power_on else PowerState.POWER_OFF
-        message = construct_message(self.monitor_id, SICPCommand.POWER_STATE_SET, param)
+        message = self._power_tmpl[bool(power_on)]
 
-        action_description = "Screen ON" if power_on else "Screen OFF"
-        logger.debug(f"Sending power control message: {action_description} to Monitor ID {self.monitor_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            action_description = "Screen ON" if power_on else "Screen OFF"
+            logger.debug("Sending power control message: %s to Monitor ID %s", action_description, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
+    async def _get_enum(self, command: SICPCommand, table: tuple, description: str, unknown: str | None = None):
+        """
+        Send a parameterless GET and decode the first reply byte through a `_code_table()`.
+        `unknown` names the value in the error raised for an unknown code, `description` by default.
+        """
+        logger.debug("Get %s for Monitor ID %s", description, self.monitor_id)
+        response = await self.send_message(self._tmpl[command], expect_data=True)
+        payload = _require_payload(response, description)
+
+        code = payload[0]
+        value = table[code]
+        if value is None:
+            raise ValueError(f"Unknown {unknown or description} 0x{code:02X}")
+        return value
+
+
+    async def _get_text(self, message: bytes, description: str) -> str:
+        """Send a GET and decode the printable ASCII text of its reply."""
+        response = await self.send_message(message, expect_data=True)
+        payload = _require_payload(response, description)
+
+        return _printable_ascii(payload)
+
+
     async def get_power_state(self) -> PowerState:
         """Query current power state."""
-        message = construct_message(self.monitor_id, SICPCommand.POWER_STATE_GET)
-        logger.debug(f"Get power state for Monitor ID {self.monitor_id}")
         try:
-            response = await self.send_message(message, expect_data=True)
+            return await self._get_enum(SICPCommand.POWER_STATE_GET, _POWER_STATE_BY_CODE, "power state", "power state value")
         # if network error, return PowerState.OFFLINE
         except NetworkError as exc:
-            # logger.error(f"Error getting power state for Monitor ID {self.monitor_id}: {exc}")
+            logger.debug("Monitor ID %s unreachable, reporting it offline: %s", self.monitor_id, exc)
             return PowerState.OFFLINE
 
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read power state")
-
-        try:
-            return PowerState(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown power state value 0x{response.data_payload[0]:02X}") from exc
-
 
     async def get_cold_start_power_state(self) -> ColdStartPowerState:
         """Query cold-start power behavior."""
-        message = construct_message(self.monitor_id, SICPCommand.COLD_START_GET)
-        logger.debug(f"Get cold-start power state for Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read cold-start power state")
-
-        try:
-            return ColdStartPowerState(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown cold-start state 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.COLD_START_GET, _COLD_START_POWER_STATE_BY_CODE, "cold-start power state", "cold-start state")
 
 
     async def set_cold_start_power_state(self, state_code: ColdStartPowerState):
         """Set cold-start power behavior."""
-        message = construct_message(self.monitor_id, SICPCommand.COLD_START_SET, state_code.value)
-        action = f"Set cold-start power state to {state_code}"
-        logger.debug(f"Sending cold-start power state message: {action} to Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.COLD_START_SET](state_code)
+        if logger.isEnabledFor(logging.DEBUG):
+            action = f"Set cold-start power state to {state_code}"
+            logger.debug("Sending cold-start power state message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_temperature(self) -> list[int] | None:
         """Read temperature sensors (returns list of Celsius values)."""
-        message = construct_message(self.monitor_id, SICPCommand.TEMPERATURE_GET)
-        logger.debug(f"Get temperature for Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.TEMPERATURE_GET]
+        logger.debug("Get temperature for Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read temperature sensors")
-    
-        temps = []
-        for idx, value in enumerate(response.data_payload):
-            # Some platforms may return invalid 0xFF for unused sensors
-            if value == 0xFF:
-                continue
-            temps.append(value)
+        payload = _require_payload(response, "temperature sensors")
 
-        if temps:
-            return temps
-
-        return None
+        # Some platforms may return invalid 0xFF for unused sensors: drop them in one pass
+        temps = list(bytes(payload).translate(None, b"\xff"))
+        return temps or None
 
 
     async def get_sicp_info(self, field: SicpInfoFields) -> str:
         """Retrieve SICP version/platform info text for the requested label code."""
-        message = construct_message(self.monitor_id, SICPCommand.SICP_INFO_GET, field.value)
-        logger.debug(f"Get SICP info ({field.name.lower()}) for Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read A/V mute state")
-
-        return ''.join(chr(b) for b in response.data_payload if 32 <= b <= 126)
+        message = self._builders[SICPCommand.SICP_INFO_GET](field)
+        logger.debug("Get SICP info (%s) for Monitor ID %s", field, self.monitor_id)
+        return await self._get_text(message, "SICP info")
 
 
     async def get_model_info(self, field: ModelInfoFields) -> str:
         """Retrieve model/firmware/build information for the given label code."""
-        message = construct_message(self.monitor_id, SICPCommand.MODEL_INFO_GET, field.value)
-        logger.debug(f"Get model info ({field.name.lower()}) for Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read A/V mute state")
-
-        return ''.join(chr(b) for b in response.data_payload if 32 <= b <= 126)
+        message = self._builders[SICPCommand.MODEL_INFO_GET](field)
+        logger.debug("Get model info (%s) for Monitor ID %s", field, self.monitor_id)
+        return await self._get_text(message, "model info")
 
 
     async def get_serial_number(self) -> str:
         """Fetch the 14-character display serial number."""
-        message = construct_message(self.monitor_id, SICPCommand.SERIAL_GET)
-        logger.debug(f"Get serial number for Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read A/V mute state")
-
-        return ''.join(chr(b) for b in response.data_payload if 32 <= b <= 126)
+        message = self._tmpl[SICPCommand.SERIAL_GET]
+        logger.debug("Get serial number for Monitor ID %s", self.monitor_id)
+        return await self._get_text(message, "serial number")
 
 
     async def get_video_signal_status(self) -> bool:
         """Determine if a video signal is present on the active input."""
-        message = construct_message(self.monitor_id, SICPCommand.VIDEO_SIGNAL_GET)
-        logger.debug(f"Get video signal status for Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.VIDEO_SIGNAL_GET]
+        logger.debug("Get video signal status for Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read video signal status")
-        return response.data_payload[0] == 0x01
+        payload = _require_payload(response, "video signal status")
+        return payload[0] == 0x01
 
 
     async def get_picture_style(self) -> PictureStyle:
         """Retrieve the current picture style value."""
-        message = construct_message(self.monitor_id, SICPCommand.PICTURE_STYLE_GET)
-        logger.debug(f"Get picture style for Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read picture style")
-
-        try:
-            return PictureStyle(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown picture style 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.PICTURE_STYLE_GET, _PICTURE_STYLE_BY_CODE, "picture style")
 
 
     async def set_picture_style(self, style_code: PictureStyle):
         """Set the picture style to the provided code."""
-        message = construct_message(self.monitor_id, SICPCommand.PICTURE_STYLE_SET, style_code.value)
-        logger.debug(f"Set picture style to {style_code} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.PICTURE_STYLE_SET](style_code)
+        logger.debug("Set picture style to %s for Monitor ID %s", style_code, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
@@ -233,9 +336,10 @@ class SICPProtocol:
 
         clamped_value = max(0, min(100, brightness_value))
 
-        message = build_video_parameters_set_message(self.monitor_id, brightness=clamped_value)
-        action = f"Set brightness to {clamped_value}%"
-        logger.debug(f"Sending brightness set message: {action} to Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.VIDEO_PARAMETERS_SET](clamped_value, *(_NO_CHANGE,) * 6)
+        if logger.isEnabledFor(logging.DEBUG):
+            action = f"Set brightness to {clamped_value}%"
+            logger.debug("Sending brightness set message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
@@ -246,12 +350,11 @@ class SICPProtocol:
 
         Same limitations as set_brightness_level() apply.
         """
-        message = construct_message(self.monitor_id, SICPCommand.VIDEO_PARAMETERS_GET)
-        logger.debug(f"Sending get brightness to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.VIDEO_PARAMETERS_GET]
+        logger.debug("Sending get brightness to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read brightness level")
-        return response.data_payload[0]
+        payload = _require_payload(response, "brightness level")
+        return payload[0]
 
     async def set_color_temperature_mode(self, mode_code: ColorTemperatureMode):
         """
@@ -259,8 +362,8 @@ class SICPProtocol:
 
         Same limitations as set_brightness_level() Note 1 and Note 2 apply.
         """
-        message = construct_message(self.monitor_id, SICPCommand.COLOR_TEMPERATURE_SET, mode_code.value)
-        logger.debug(f"Sending set color temperature to {mode_code} to Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.COLOR_TEMPERATURE_SET](mode_code)
+        logger.debug("Sending set color temperature to %s to Monitor ID %s", mode_code, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
@@ -271,16 +374,7 @@ class SICPProtocol:
 
         Same limitations as set_brightness_level() Note 1 and Note 2 apply.
         """
-        message = construct_message(self.monitor_id, SICPCommand.COLOR_TEMPERATURE_GET)
-        logger.debug(f"Sending get color temperature to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read color temperature mode")
-
-        try:
-            return ColorTemperatureMode(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown color temperature mode 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.COLOR_TEMPERATURE_GET, _COLOR_TEMPERATURE_MODE_BY_CODE, "color temperature mode")
 
 
     async def set_precise_color_temperature(self, kelvin_value):
@@ -296,9 +390,10 @@ class SICPProtocol:
             logger.warning("Unable to set base color temperature to User 2; precise adjustment skipped")
             return False
 
-        message = construct_message(self.monitor_id, SICPCommand.COLOR_TEMPERATURE_FINE_SET, step_value)
-        action = f"Set precise color temperature to {resolved_kelvin}K"
-        logger.debug(f"Sending set precise color temperature message: {action} to Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.COLOR_TEMPERATURE_FINE_SET](step_value)
+        if logger.isEnabledFor(logging.DEBUG):
+            action = f"Set precise color temperature to {resolved_kelvin}K"
+            logger.debug("Sending set precise color temperature message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
@@ -307,13 +402,12 @@ class SICPProtocol:
         """
         Same limitations as set_precise_color_temperature().
         """
-        message = construct_message(self.monitor_id, SICPCommand.COLOR_TEMPERATURE_FINE_GET)
-        logger.debug(f"Sending get precise color temperature to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.COLOR_TEMPERATURE_FINE_GET]
+        logger.debug("Sending get precise color temperature to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read precise color temperature")
+        payload = _require_payload(response, "precise color temperature")
 
-        step_value = response.data_payload[0]
+        step_value = payload[0]
         if 20 <= step_value <= 100:
             return step_value * 100
 
@@ -324,16 +418,7 @@ class SICPProtocol:
         """
         Retrieve the current internal test pattern (SICP 2.06 onwards).
         """
-        message = construct_message(self.monitor_id, SICPCommand.TEST_PATTERN_GET)
-        logger.debug(f"Sending get test pattern to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read test pattern")
-
-        try:
-            return TestPattern(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown test pattern code 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.TEST_PATTERN_GET, _TEST_PATTERN_BY_CODE, "test pattern", "test pattern code")
 
 
     async def set_test_pattern(self, pattern_code: TestPattern):
@@ -343,30 +428,21 @@ class SICPProtocol:
         This command is not supported on the xxBDL4550D / xxBDL3550Q / xxBDL3452T / xxBDL3651T.
         Supported from SICP version 2.06 onwards.
         """
-        message = construct_message(self.monitor_id, SICPCommand.TEST_PATTERN_SET, pattern_code.value)
-        logger.debug(f"Sending set test pattern to {pattern_code} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.TEST_PATTERN_SET](pattern_code)
+        logger.debug("Sending set test pattern to %s for Monitor ID %s", pattern_code, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_remote_lock_state(self) -> RemoteLockState:
         """Retrieve the current remote control/keypad lock mode."""
-        message = construct_message(self.monitor_id, SICPCommand.REMOTE_LOCK_GET)
-        logger.debug(f"Sending get remote lock state to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read remote lock state")
-
-        try:
-            return RemoteLockState(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown remote lock state 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.REMOTE_LOCK_GET, _REMOTE_LOCK_STATE_BY_CODE, "remote lock state")
 
 
     async def set_remote_lock_state(self, state_code: RemoteLockState):
         """Set the remote control/keypad lock mode."""
-        message = construct_message(self.monitor_id, SICPCommand.REMOTE_LOCK_SET, state_code.value)
-        logger.debug(f"Sending set remote lock to {state_code} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.REMOTE_LOCK_SET](state_code)
+        logger.debug("Sending set remote lock to %s for Monitor ID %s", state_code, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
@@ -374,42 +450,32 @@ class SICPProtocol:
     async def simulate_remote_key(self, key_code: RemoteKey):
         """Simulate a button press on the remote control (SICP 2.10 onwards)."""
         reserved = 0x00
-        message = construct_message(self.monitor_id, SICPCommand.REMOTE_CONTROL_SIM, key_code.value, reserved)
-        logger.debug(f"Sending simulate remote key {key_code} to Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.REMOTE_CONTROL_SIM](key_code, reserved)
+        logger.debug("Sending simulate remote key %s to Monitor ID %s", key_code, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_power_on_logo_mode(self) -> PowerOnLogoMode:
         """Retrieve the power-on logo mode (off|on|user)."""
-        message = construct_message(self.monitor_id, SICPCommand.POWER_ON_LOGO_GET)
-        logger.debug(f"Sending get power-on logo to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read power-on logo mode")
-
-        try:
-            return PowerOnLogoMode(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown power-on logo mode 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.POWER_ON_LOGO_GET, _POWER_ON_LOGO_MODE_BY_CODE, "power-on logo mode")
 
 
     async def set_power_on_logo_mode(self, mode: PowerOnLogoMode):
         """Set the power-on logo mode. User mode must be set in the admin options (Home + 1888) and uploading an android bootanimation file."""
-        message = construct_message(self.monitor_id, SICPCommand.POWER_ON_LOGO_SET, mode.value)
-        logger.debug(f"Sending set power-on logo to {mode} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.POWER_ON_LOGO_SET](mode)
+        logger.debug("Sending set power-on logo to %s for Monitor ID %s", mode, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_osd_info_timeout(self) -> int:
         """Retrieve the information OSD timeout (0=off, 1-60 seconds)."""
-        message = construct_message(self.monitor_id, SICPCommand.OSD_INFO_GET)
-        logger.debug(f"Sending get information OSD to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.OSD_INFO_GET]
+        logger.debug("Sending get information OSD to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read information OSD timeout")
-        return response.data_payload[0]
+        payload = _require_payload(response, "information OSD timeout")
+        return payload[0]
 
 
     async def set_osd_info_timeout(self, timeout: int):
@@ -417,72 +483,46 @@ class SICPProtocol:
         if not (0 <= timeout <= 0x3C):
             raise ValueError("OSD timeout must be 0 (off) or between 1 and 60 seconds")
 
-        message = construct_message(self.monitor_id, SICPCommand.OSD_INFO_SET, timeout)
-        label = "off" if timeout == 0 else f"{timeout} sec"
-        logger.debug(f"Sending set information OSD to {label} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.OSD_INFO_SET](timeout)
+        if logger.isEnabledFor(logging.DEBUG):
+            label = "off" if timeout == 0 else f"{timeout} sec"
+            logger.debug("Sending set information OSD to %s for Monitor ID %s", label, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_auto_signal_mode(self) -> AutoSignalMode:
         """Retrieve the auto signal detection mode (SICP 2.05 onwards)."""
-        message = construct_message(self.monitor_id, SICPCommand.AUTO_SIGNAL_GET)
-        logger.debug(f"Sending get auto signal detection to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read auto signal mode")
-
-        try:
-            return AutoSignalMode(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown auto signal mode 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.AUTO_SIGNAL_GET, _AUTO_SIGNAL_MODE_BY_CODE, "auto signal mode")
 
 
     async def set_auto_signal_mode(self, mode: AutoSignalMode):
         """Set the auto signal detection mode."""
-        if not (0 <= mode.value <= 0x05):
+        if not (0 <= mode <= 0x05):
             raise ValueError("Auto signal mode must be between 0 and 5")
 
-        message = construct_message(self.monitor_id, SICPCommand.AUTO_SIGNAL_SET, mode.value)
-        logger.debug(f"Sending set auto signal detection to {mode} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.AUTO_SIGNAL_SET](mode)
+        logger.debug("Sending set auto signal detection to %s for Monitor ID %s", mode, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_power_save_mode(self) -> PowerSaveMode:
         """Retrieve the current power save mode."""
-        message = construct_message(self.monitor_id, SICPCommand.POWER_SAVE_GET)
-        logger.debug(f"Sending get power save mode to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read power save mode")
-
-        try:
-            return PowerSaveMode(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown power save mode 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.POWER_SAVE_GET, _POWER_SAVE_MODE_BY_CODE, "power save mode")
 
 
     async def set_power_save_mode(self, mode: PowerSaveMode):
         """Set the display power save mode."""
-        message = construct_message(self.monitor_id, SICPCommand.POWER_SAVE_SET, mode.value)
-        logger.debug(f"Sending set power save mode to {mode} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.POWER_SAVE_SET](mode)
+        logger.debug("Sending set power save mode to %s for Monitor ID %s", mode, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_smart_power_level(self) -> SmartPowerLevel:
         """Retrieve the current smart power level."""
-        message = construct_message(self.monitor_id, SICPCommand.SMART_POWER_GET)
-        logger.debug(f"Sending get smart power level to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read smart power level")
-
-        try:
-            return SmartPowerLevel(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown smart power level 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.SMART_POWER_GET, _SMART_POWER_LEVEL_BY_CODE, "smart power level")
 
 
     async def set_smart_power_level(self, level: SmartPowerLevel):
@@ -494,52 +534,43 @@ class SICPProtocol:
             MEDIUM: 80% of power consumption relative to current settings
             HIGH: 65% of power consumption relative to current settings
         """
-        message = construct_message(self.monitor_id, SICPCommand.SMART_POWER_SET, level.value)
-        logger.debug(f"Sending set smart power level to {level} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.SMART_POWER_SET](level)
+        logger.debug("Sending set smart power level to %s for Monitor ID %s", level, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_apm_mode(self) -> ApmMode:
         """Retrieve the current advanced power management mode."""
-        message = construct_message(self.monitor_id, SICPCommand.APM_GET)
-        logger.debug(f"Sending get advanced power management to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read advanced power management mode")
-
-        try:
-            return ApmMode(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown APM mode 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.APM_GET, _APM_MODE_BY_CODE, "advanced power management mode", "APM mode")
 
 
     async def set_apm_mode(self, mode: ApmMode):
         """Set the advanced power management mode."""
-        message = construct_message(self.monitor_id, SICPCommand.APM_SET, mode.value)
-        logger.debug(f"Sending set advanced power management to {mode} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.APM_SET](mode)
+        logger.debug("Sending set advanced power management to %s for Monitor ID %s", mode, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_group_id(self) -> int:
         """Retrieve the current group ID (1-254, or 0xFF for off)."""
-        message = construct_message(self.monitor_id, SICPCommand.GROUP_ID_GET)
-        logger.debug(f"Sending get group ID to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.GROUP_ID_GET]
+        logger.debug("Sending get group ID to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read group ID")
-        return response.data_payload[0]
+        payload = _require_payload(response, "group ID")
+        return payload[0]
 
 
     async def set_group_id(self, group_value: int):
         """Set the display group ID."""
-        if not ((1 <= group_value <= 0xFE) or group_value == 0xFF):
+        if not 1 <= group_value <= 0xFF:  # 0xFF (off) is the top of the range
             raise ValueError("Group ID must be 1-254 or 0xFF for off")
 
-        message = construct_message(self.monitor_id, SICPCommand.GROUP_ID_SET, group_value)
-        label = "off" if group_value == 0xFF else str(group_value)
-        logger.debug(f"Sending set group ID to {label} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.GROUP_ID_SET](group_value)
+        if logger.isEnabledFor(logging.DEBUG):
+            label = "off" if group_value == 0xFF else str(group_value)
+            logger.debug("Sending set group ID to %s for Monitor ID %s", label, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
@@ -549,8 +580,8 @@ class SICPProtocol:
         if not 1 <= new_monitor_id <= 0xFF:
             raise ValueError("Monitor ID must be between 1 and 255")
 
-        message = construct_message(self.monitor_id, SICPCommand.MONITOR_ID_SET, new_monitor_id)
-        logger.debug(f"Sending set monitor ID to {new_monitor_id} for Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.MONITOR_ID_SET](new_monitor_id)
+        logger.debug("Sending set monitor ID to %s for Monitor ID %s", new_monitor_id, self.monitor_id)
         response = await self.send_message(message)
 
         if response and response.is_ack:
@@ -563,22 +594,22 @@ class SICPProtocol:
 
     async def set_backlight(self, backlight_on: bool):
         """Control display backlight state."""
-        message = construct_message(self.monitor_id, SICPCommand.BACKLIGHT_SET, 0x00 if backlight_on else 0x01)
-        action = "Backlight ON" if backlight_on else "Backlight OFF"
-        logger.debug(f"Sending backlight control message: {action} to Monitor ID {self.monitor_id}")
+        message = self._toggle_tmpl[SICPCommand.BACKLIGHT_SET][not backlight_on]
+        if logger.isEnabledFor(logging.DEBUG):
+            action = "Backlight ON" if backlight_on else "Backlight OFF"
+            logger.debug("Sending backlight control message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_backlight_state(self) -> bool:
         """Get current display backlight state."""
-        message = construct_message(self.monitor_id, SICPCommand.BACKLIGHT_GET)
-        logger.debug(f"Sending get backlight state to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.BACKLIGHT_GET]
+        logger.debug("Sending get backlight state to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read backlight state")
+        payload = _require_payload(response, "backlight state")
 
-        state_byte = response.data_payload[0]
+        state_byte = payload[0]
         # Spec indicates 0x00 = On, 0x01 = Off
         return state_byte == 0x00
 
@@ -589,112 +620,109 @@ class SICPProtocol:
         
         Available from SICP 2.11 onwards.
         """
-        message = construct_message(self.monitor_id, SICPCommand.ANDROID_4K_SET, 0x01 if enable_4k else 0x00)
-        action = "Android 4K ENABLED" if enable_4k else "Android 4K DISABLED"
-        logger.debug(f"Sending Android 4K control message: {action} to Monitor ID {self.monitor_id}")
+        message = self._toggle_tmpl[SICPCommand.ANDROID_4K_SET][enable_4k]
+        if logger.isEnabledFor(logging.DEBUG):
+            action = "Android 4K ENABLED" if enable_4k else "Android 4K DISABLED"
+            logger.debug("Sending Android 4K control message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_android_4k_state(self) -> bool:
         """Get current Android 4K state."""
-        message = construct_message(self.monitor_id, SICPCommand.ANDROID_4K_GET)
-        logger.debug(f"Sending get Android 4K state to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.ANDROID_4K_GET]
+        logger.debug("Sending get Android 4K state to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read Android 4K state")
+        payload = _require_payload(response, "Android 4K state")
 
-        state_byte = response.data_payload[0]
+        state_byte = payload[0]
         return state_byte == 0x01
 
 
     async def set_wol(self, enable_wol: bool):
         """Control Wake on LAN state."""
-        message = construct_message(self.monitor_id, SICPCommand.WOL_SET, 0x01 if enable_wol else 0x00)
-        action = "Wake on LAN ON" if enable_wol else "Wake on LAN OFF"
-        logger.debug(f"Sending set Wake on LAN message: {action} to Monitor ID {self.monitor_id}")
+        message = self._toggle_tmpl[SICPCommand.WOL_SET][enable_wol]
+        if logger.isEnabledFor(logging.DEBUG):
+            action = "Wake on LAN ON" if enable_wol else "Wake on LAN OFF"
+            logger.debug("Sending set Wake on LAN message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_wake_on_lan(self) -> bool:
         """Retrieve the Wake on LAN (WOL) setting (0x00 off, 0x01 on)."""
-        message = construct_message(self.monitor_id, SICPCommand.WOL_GET)
-        logger.debug(f"Sending get Wake on LAN state to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.WOL_GET]
+        logger.debug("Sending get Wake on LAN state to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read Wake on LAN state")
+        payload = _require_payload(response, "Wake on LAN state")
 
-        return response.data_payload[0] == 0x01
+        return payload[0] == 0x01
 
     async def set_volume(self, speaker_level: int|None = None, audio_out_level: int|None = None):
         """Set speaker/audio-out volume (0-100, None = no change)."""
-        if speaker_level is not None and not 0 <= speaker_level <= 100:
-            raise ValueError("Speaker volume must be between 0 and 100")
-
-        if audio_out_level is not None and not 0 <= audio_out_level <= 100:
-            raise ValueError("Audio out volume must be between 0 and 100")
-
-        message = build_volume_set_message(self.monitor_id, speaker_level, audio_out_level)
-        speaker_desc = "no change" if speaker_level is None else f"{speaker_level}%"
-        audio_desc = "no change" if audio_out_level is None else f"{audio_out_level}%"
-        action = f"Set volume (speaker={speaker_desc}, audio-out={audio_desc})"
-        logger.debug(f"Sending set volume message: {action} to Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.VOLUME_SET](
+            _volume_parameter("Speaker", speaker_level),
+            _volume_parameter("Audio out", audio_out_level),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            speaker_desc = "no change" if speaker_level is None else f"{speaker_level}%"
+            audio_desc = "no change" if audio_out_level is None else f"{audio_out_level}%"
+            action = f"Set volume (speaker={speaker_desc}, audio-out={audio_desc})"
+            logger.debug("Sending set volume message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_volume(self) -> tuple[int, int | None]:
         """Get current speaker/audio-out volume levels."""
-        message = construct_message(self.monitor_id, SICPCommand.VOLUME_GET)
-        logger.debug(f"Sending get volume to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.VOLUME_GET]
+        logger.debug("Sending get volume to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read volume levels")
+        payload = _require_payload(response, "volume levels")
 
-        speaker = response.data_payload[0]
-        audio_out = response.data_payload[1] if len(response.data_payload) > 1 else None
+        speaker, *rest = payload
+        audio_out = rest[0] if rest else None
         return speaker, audio_out
 
 
     async def set_mute(self, mute_on: bool):
         """Set mute state for both speaker and audio-out."""
-        message = construct_message(self.monitor_id, SICPCommand.MUTE_SET, 0x01 if mute_on else 0x00)
-        action = "Mute ON" if mute_on else "Mute OFF"
-        logger.debug(f"Sending set mute message: {action} to Monitor ID {self.monitor_id}")
+        message = self._toggle_tmpl[SICPCommand.MUTE_SET][mute_on]
+        if logger.isEnabledFor(logging.DEBUG):
+            action = "Mute ON" if mute_on else "Mute OFF"
+            logger.debug("Sending set mute message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_mute(self) -> bool:
         """Get mute status."""
-        message = construct_message(self.monitor_id, SICPCommand.MUTE_GET)
-        logger.debug(f"Sending get mute status to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.MUTE_GET]
+        logger.debug("Sending get mute status to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read mute status")
+        payload = _require_payload(response, "mute status")
 
-        return response.data_payload[0] == 0x01
+        return payload[0] == 0x01
 
 
     async def set_av_mute(self, mute_on: bool):
         """Enable or disable A/V mute (backlight, audio, touch)."""
-        message = construct_message(self.monitor_id, SICPCommand.AV_MUTE_SET, 0x01 if mute_on else 0x00)
-        action = "A/V Mute ON" if mute_on else "A/V Mute OFF"
-        logger.debug(f"Sending set A/V mute message: {action} to Monitor ID {self.monitor_id}")
+        message = self._toggle_tmpl[SICPCommand.AV_MUTE_SET][mute_on]
+        if logger.isEnabledFor(logging.DEBUG):
+            action = "A/V Mute ON" if mute_on else "A/V Mute OFF"
+            logger.debug("Sending set A/V mute message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_av_mute(self) -> bool:
         """Retrieve current A/V mute state."""
-        message = construct_message(self.monitor_id, SICPCommand.AV_MUTE_GET)
-        logger.debug(f"Sending get A/V mute to Monitor ID {self.monitor_id}")
+        message = self._tmpl[SICPCommand.AV_MUTE_GET]
+        logger.debug("Sending get A/V mute to Monitor ID %s", self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read A/V mute state")
+        payload = _require_payload(response, "A/V mute state")
 
-        return response.data_payload[0] == 0x01
+        return payload[0] == 0x01
 
     async def get_ip_parameter(
         self,
@@ -703,27 +731,18 @@ class SICPProtocol:
     ) -> str:
         """Get IP parameter or MAC address information."""
 
-        parameter_code = parameter.value
-        value_type_code = value_type.value
-
-        message = construct_message(
-            self.monitor_id,
-            SICPCommand.IP_PARAMETER_GET,
-            parameter_code,
-            value_type_code,
-        )
-        action = f"Get {parameter} ({value_type})"
-        logger.debug(f"Sending IP parameter get message: {action} to Monitor ID {self.monitor_id}")
+        message = self._builders[SICPCommand.IP_PARAMETER_GET](parameter, value_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            action = f"Get {parameter} ({value_type})"
+            logger.debug("Sending IP parameter get message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read A/V mute state")
+        payload = _require_payload(response, "IP parameter")
 
-        if len(response.data_payload) < 2:
+        if len(payload) < 2:
             raise RuntimeError("Unexpected IP parameter response payload")
 
-        reported_parameter = response.data_payload[0]
-        _reported_type = response.data_payload[1]
-        value_bytes = response.data_payload[2:]
+        reported_parameter, _reported_type = _IP_PARAMETER_HEADER.unpack_from(payload)
+        value_bytes = payload[_IP_PARAMETER_HEADER.size:]  # memoryview slice, no copy
 
         formatted, _, _ = _format_ip_parameter_value(reported_parameter, value_bytes)
         return formatted
@@ -736,32 +755,22 @@ class SICPProtocol:
         effect_duration: int = 0,
     ):
         """Set display input source."""
-        message = construct_message(
-            self.monitor_id,
-            SICPCommand.INPUT_SOURCE_SET,
-            input_source.value,
+        message = self._builders[SICPCommand.INPUT_SOURCE_SET](
+            input_source,
             playlist,
             osd_style,
             effect_duration,
         )
 
-        playlist_info = f" (playlist {playlist})" if playlist > 0 else ""
-        action = f"Set input to {input_source}{playlist_info}"
-        logger.debug(f"Sending set input source message: {action} to Monitor ID {self.monitor_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            playlist_info = f" (playlist {playlist})" if playlist > 0 else ""
+            action = f"Set input to {input_source}{playlist_info}"
+            logger.debug("Sending set input source message: %s to Monitor ID %s", action, self.monitor_id)
         response = await self.send_message(message)
         return response and response.is_ack
 
 
     async def get_input_source(self) -> InputSource:
         """Get current display input source."""
-        message = construct_message(self.monitor_id, SICPCommand.CURRENT_SOURCE_GET)
-        logger.debug(f"Sending get input source to Monitor ID {self.monitor_id}")
-        response = await self.send_message(message, expect_data=True)
-        if not response or not response.data_payload:
-            raise RuntimeError("Unable to read current input source")
-
-        try:
-            return InputSource(response.data_payload[0])
-        except ValueError as exc:
-            raise ValueError(f"Unknown input source code 0x{response.data_payload[0]:02X}") from exc
+        return await self._get_enum(SICPCommand.CURRENT_SOURCE_GET, _INPUT_SOURCE_BY_CODE, "current input source", "input source code")
 
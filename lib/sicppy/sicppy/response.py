@@ -1,8 +1,42 @@
+import struct
+
 from .messages import SICPCommand, RESPONSE_ACK, RESPONSE_NAV, RESPONSE_NACK
 
+# [size][monitor_id][group_id][command] prefix shared by every frame
+_HEADER = struct.Struct("BBBB")
+
+# Communication Control response code -> (flag attribute, error message)
+_RESPONSE_CODES = {
+    RESPONSE_ACK: ("is_ack", None),
+    RESPONSE_NAV: ("is_nav", "Command not supported/available (NAV)"),
+    RESPONSE_NACK: ("is_nack", "Checksum or format error (NACK)"),
+}
+
 class SicpResponse:
-    """Parse and represent a SICP response."""
-    
+    """
+    Parse and represent a SICP response.
+
+    `data_payload` is a read-only memoryview of the payload bytes (it used to be a
+    list of ints). Indexing and iterating still give ints; use `list()` or `bytes()`
+    on it where a list or bytes object is needed.
+    """
+
+    # One response is built per reply: skip the per-instance __dict__
+    __slots__ = (
+        "raw_data",
+        "valid",
+        "is_ack",
+        "is_nav",
+        "is_nack",
+        "is_data_response",
+        "command",
+        "response_code",
+        "data_payload",
+        "error_message",
+        "size",
+        "monitor_id",
+    )
+
     def __init__(self, data):
         self.raw_data = data
         self. valid = False
@@ -11,45 +45,41 @@ class SicpResponse:
         self.is_nack = False
         self.is_data_response = False
         self.command = None
-        self.data_payload = []
+        self.response_code = None
+        self.data_payload = memoryview(b"")
         self.error_message = None
         
         if not data or len(data) < 5:
             self.error_message = "Response too short"
             return
         
-        self.size = data[0]
-        self.monitor_id = data[1]
+        self.size, self.monitor_id, _group_id, command = _HEADER.unpack_from(data)
         
         # Check if this is a Communication Control response (ACK/NAV/NACK)
-        if len(data) >= 6 and data[3] == SICPCommand.COMMUNICATION_CONTROL: 
+        if command == SICPCommand.COMMUNICATION_CONTROL and len(data) >= 6:
             self.command = SICPCommand.COMMUNICATION_CONTROL
-            response_code = data[4]
-            
-            if response_code == RESPONSE_ACK:
-                self. is_ack = True
-                self.valid = True
-            elif response_code == RESPONSE_NAV:
-                self.is_nav = True
-                self. valid = True
-                self.error_message = "Command not supported/available (NAV)"
-            elif response_code == RESPONSE_NACK:
-                self.is_nack = True
-                self.valid = True
-                self.error_message = "Checksum or format error (NACK)"
-            else:
+            self.response_code = response_code = data[4]
+
+            handler = _RESPONSE_CODES.get(response_code)
+            if handler is None:
                 self.error_message = f"Unknown response code: 0x{response_code:02x}"
+            else:
+                flag, self.error_message = handler
+                setattr(self, flag, True)
+                self.valid = True
         
         # Otherwise it's a data response (e.g., from a GET command)
-        elif len(data) >= 5:
+        else:
             self.is_data_response = True
             self.valid = True
-            self.command = data[3]
-            # Data payload starts at byte 4 and goes until checksum (last byte)
-            self.data_payload = list(data[4:-1])
+            self.command = command
+            # Data payload starts at byte 4 and goes until checksum (last byte).
+            # The reply is copied into bytes once (no copy when it already is bytes), the
+            # payload and any later slice of it are read-only views over that copy.
+            self.data_payload = memoryview(bytes(data))[4:-1]
     
     def __str__(self):
-        hex_data = ' '.join(f'{b:02x}' for b in self.raw_data)
+        hex_data = bytes(self.raw_data).hex(' ')
         if self.is_ack:
             return f"ACK - {hex_data}"
         elif self.is_nav:
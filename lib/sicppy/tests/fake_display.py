@@ -0,0 +1,108 @@
+"""In-process SICP display answering over TCP, for tests."""
+import asyncio
+import unittest
+from functools import reduce
+from operator import xor
+
+from sicppy.ip_monitor import SICPIPMonitor
+from sicppy.messages import SICPCommand, PowerState, RESPONSE_ACK
+
+
+def _frame(*body: int) -> bytes:
+    """Prefix the size byte and append the checksum."""
+    frame = bytes((len(body) + 2, *body))
+    return frame + bytes((reduce(xor, frame, 0),))
+
+
+class FakeDisplay:
+    """
+    Answer frames in the order they were received, each after `delay` seconds.
+    Replies of different frames overlap, like a display answering a pipelined burst.
+    """
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.power_state = PowerState.POWER_ON
+        self.mute = False
+        self.volume = (40, 50)
+        self.temperatures = (30, 0xFF, 31)
+        self.sicp_info = b"SICP 2.0"
+        # Command bytes in the order they arrived on the wire
+        self.received: list[int] = []
+        # Commands answered with nothing, once each
+        self.unanswered: set[int] = set()
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def reply(self, frame: bytes) -> bytes | None:
+        monitor_id, command = frame[1], frame[3]
+        if command in self.unanswered:
+            self.unanswered.discard(command)
+            return None
+
+        match command:
+            case SICPCommand.POWER_STATE_GET:
+                payload = (self.power_state,)
+            case SICPCommand.MUTE_GET:
+                payload = (int(self.mute),)
+            case SICPCommand.VOLUME_GET:
+                payload = self.volume
+            case SICPCommand.TEMPERATURE_GET:
+                payload = self.temperatures
+            case SICPCommand.SICP_INFO_GET:
+                # Any label code is answered, named or not
+                payload = (frame[4], *self.sicp_info)
+            case _:
+                if command == SICPCommand.MUTE_SET:
+                    self.mute = frame[4] == 0x01
+                return _frame(monitor_id, 0x00, SICPCommand.COMMUNICATION_CONTROL, RESPONSE_ACK)
+        return _frame(monitor_id, 0x01, command, *payload)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        loop = asyncio.get_running_loop()
+        replies: asyncio.Queue[tuple[float, bytes | None]] = asyncio.Queue()
+
+        async def write_replies() -> None:
+            while True:
+                due, reply = await replies.get()
+                await asyncio.sleep(max(0, due - loop.time()))
+                if reply is not None:
+                    writer.write(reply)
+
+        writer_task = asyncio.create_task(write_replies())
+        try:
+            while True:
+                size = await reader.readexactly(1)
+                frame = size + await reader.readexactly(size[0] - 1)
+                self.received.append(frame[3])
+                replies.put_nowait((loop.time() + self.delay, self.reply(frame)))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer_task.cancel()
+            writer.close()
+
+
+class FakeDisplayTestCase(unittest.IsolatedAsyncioTestCase):
+    """Run each test against a fresh FakeDisplay, with `self.monitor` pointed at it."""
+
+    async def asyncSetUp(self) -> None:
+        self.display = FakeDisplay()
+        await self.display.start()
+        self.monitor = SICPIPMonitor("127.0.0.1", monitor_id=1, port=self.display.port, timeout=1)
+
+    async def asyncTearDown(self) -> None:
+        await self.monitor.close()
+        await self.display.stop()
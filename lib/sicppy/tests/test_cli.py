@@ -0,0 +1,30 @@
+import asyncio
+import unittest
+
+from sicppy.cli import _run_commands_for_monitor
+from sicppy.messages import SICPCommand
+
+from .fake_display import FakeDisplayTestCase
+
+
+class CommandBatchTest(FakeDisplayTestCase):
+    async def test_commands_are_pipelined_in_the_order_given(self) -> None:
+        commands = [["get_mute"], ["set_mute", "true"], ["get_mute"]]
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        all_ok, lines = await _run_commands_for_monitor(self.monitor, commands)
+        elapsed = loop.time() - start
+
+        self.assertTrue(all_ok)
+        self.assertEqual(
+            self.display.received, [SICPCommand.MUTE_GET, SICPCommand.MUTE_SET, SICPCommand.MUTE_GET]
+        )
+        self.assertTrue(lines[0].endswith("Mute = False"))
+        self.assertTrue(lines[2].endswith("Mute = True"))
+        # One round trip for the whole batch
+        self.assertLess(elapsed, 2 * self.display.delay)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from sicppy.easycli import async_execute_command_and_return_log
+from sicppy.messages import SICPCommand
+
+from .fake_display import FakeDisplayTestCase
+
+
+class EnumArgumentTest(FakeDisplayTestCase):
+    async def test_unnamed_code_reaches_the_display(self) -> None:
+        log = await async_execute_command_and_return_log(self.monitor, "get_sicp_info", ["0x07"])
+
+        self.assertIn("SICP 2.0", log)
+        self.assertEqual(self.display.received, [SICPCommand.SICP_INFO_GET])
+
+    async def test_named_code_is_accepted_by_name(self) -> None:
+        log = await async_execute_command_and_return_log(self.monitor, "get_sicp_info", ["platform_version"])
+
+        self.assertIn("SICP 2.0", log)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+
+from sicppy.errors import NetworkError, ProtocolError
+from sicppy.messages import PowerState, SICPCommand
+
+from .fake_display import FakeDisplayTestCase
+
+
+class PipeliningTest(FakeDisplayTestCase):
+    async def test_concurrent_getters_share_one_round_trip(self) -> None:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await asyncio.gather(
+            self.monitor.get_power_state(),
+            self.monitor.get_volume(),
+            self.monitor.get_temperature(),
+            self.monitor.get_mute(),
+        )
+        elapsed = loop.time() - start
+
+        self.assertEqual(results, [PowerState.POWER_ON, (40, 50), [30, 31], False])
+        self.assertEqual(self.display.connections, 1)
+        self.assertLess(elapsed, 3 * self.display.delay)
+
+    async def test_lost_reply_is_not_handed_to_the_next_request(self) -> None:
+        self.display.unanswered.add(SICPCommand.TEMPERATURE_GET)
+
+        results = await asyncio.gather(
+            self.monitor.get_temperature(),
+            self.monitor.get_volume(),
+            self.monitor.get_mute(),
+            return_exceptions=True,
+        )
+
+        # Every request of the desynchronized connection fails, none gets another one's reply
+        for result in results:
+            self.assertIsInstance(result, ProtocolError)
+        self.assertFalse(self.monitor._deadlines)
+        # A fresh connection is in sync again
+        self.assertEqual(await self.monitor.get_volume(), (40, 50))
+        self.assertEqual(self.display.connections, 2)
+
+    async def test_cancelled_request_does_not_shift_replies(self) -> None:
+        temperature = asyncio.create_task(self.monitor.get_temperature())
+        volume = asyncio.create_task(self.monitor.get_volume())
+        await asyncio.sleep(self.display.delay / 2)  # both frames are on the wire
+        temperature.cancel()
+
+        self.assertEqual(await volume, (40, 50))
+        self.assertFalse(await self.monitor.get_mute())
+        self.assertEqual(self.display.connections, 1)
+
+    async def test_answered_batch_cancels_its_read_timeout(self) -> None:
+        await asyncio.gather(self.monitor.get_volume(), self.monitor.get_mute())
+
+        self.assertFalse(self.monitor._deadlines)
+
+    async def test_missing_last_reply_times_out(self) -> None:
+        self.monitor.timeout = 0.2
+        self.display.unanswered.add(SICPCommand.MUTE_GET)
+
+        volume, mute = await asyncio.gather(
+            self.monitor.get_volume(), self.monitor.get_mute(), return_exceptions=True
+        )
+
+        self.assertEqual(volume, (40, 50))
+        self.assertIsInstance(mute, NetworkError)
+        self.assertFalse(self.monitor._deadlines)
+
+    async def test_close_cancels_the_read_timeout(self) -> None:
+        volume = asyncio.create_task(self.monitor.get_volume())
+        await asyncio.sleep(self.display.delay / 2)  # the frame is on the wire
+        self.assertTrue(self.monitor._deadlines)
+
+        await self.monitor.close()
+
+        with self.assertRaises(NetworkError):
+            await volume
+        self.assertFalse(self.monitor._deadlines)
+
+    async def test_cancelled_flush_fails_its_requests(self) -> None:
+        volume = asyncio.create_task(self.monitor.get_volume())
+        await asyncio.sleep(0)  # the frame is queued, not yet sent
+        self.monitor._flush_task.cancel()
+
+        with self.assertRaises(NetworkError):
+            await asyncio.wait_for(volume, 1)
+        self.assertEqual(await self.monitor.get_volume(), (40, 50))
+
+    async def test_crashed_flush_fails_its_requests(self) -> None:
+        async def crash(frames) -> None:
+            raise RuntimeError("boom")
+
+        self.monitor._send_raw_batch = crash
+        with self.assertRaises(NetworkError):
+            await asyncio.wait_for(self.monitor.get_volume(), 1)
+
+    async def test_frames_go_on_the_wire_in_call_order(self) -> None:
+        muted_before, acked = await asyncio.gather(self.monitor.get_mute(), self.monitor.set_mute(True))
+
+        self.assertEqual(self.display.received, [SICPCommand.MUTE_GET, SICPCommand.MUTE_SET])
+        self.assertFalse(muted_before)
+        self.assertTrue(acked)
+        self.assertTrue(await self.monitor.get_mute())
+
+    async def test_concurrent_identical_getters_share_one_request(self) -> None:
+        first, second = await asyncio.gather(self.monitor.get_mute(), self.monitor.get_mute())
+        self.assertFalse(first)
+        self.assertFalse(second)
+        self.assertEqual(self.display.received, [SICPCommand.MUTE_GET])
+
+        # Not kept once answered, unless a cache_ttl is given
+        self.display.mute = True
+        self.assertTrue(await self.monitor.get_mute())
+        self.assertEqual(self.display.received, [SICPCommand.MUTE_GET] * 2)
+
+    async def test_get_reply_is_reused_within_cache_ttl(self) -> None:
+        self.monitor.cache_ttl = 10
+        self.assertEqual(await self.monitor.get_volume(), (40, 50))
+        self.assertEqual(await self.monitor.get_volume(), (40, 50))
+        self.assertEqual(self.display.received, [SICPCommand.VOLUME_GET])
+
+        # A SET clears the shared replies
+        await self.monitor.set_mute(True)
+        await self.monitor.get_volume()
+        self.assertEqual(
+            self.display.received, [SICPCommand.VOLUME_GET, SICPCommand.MUTE_SET, SICPCommand.VOLUME_GET]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()